@@ -204,7 +204,13 @@ def hist_with_stats(data, bin_range=(-np.inf, np.inf), n_bins=10):
     """
     v_min, v_max = _get_outer_edges(data, bin_range)
 
-    filtered = data[(data >= v_min) & (data <= v_max)]
+    lb, ub = bin_range
+    if np.isfinite(lb) or np.isfinite(ub):
+        filtered = data[(data >= v_min) & (data <= v_max)]
+    else:
+        # outer edges are the min/max of the data, so no element can be
+        # filtered out and we save the temporary masks and the copy
+        filtered = data.ravel()
     hist, bin_edges = np.histogram(
         filtered, bins=n_bins, range=(v_min, v_max))
     bin_centers = (bin_edges[1:] + bin_edges[:-1]) / 2.0
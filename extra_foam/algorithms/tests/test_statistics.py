@@ -143,6 +143,15 @@ class TestStatistics:
         with pytest.raises(ValueError):
             hist_with_stats(roi, (-np.inf, np.inf), 4)
 
+        # case 5 (infinite bin range)
+        roi = np.array([[0, 1, 2], [3, 4, 6]], dtype=np.float32)
+        hist, bin_centers, mean, median, std = hist_with_stats(roi, (-np.inf, np.inf), 3)
+        np.testing.assert_array_equal([2, 2, 2], hist)
+        np.testing.assert_array_equal([1, 3, 5], bin_centers)
+        assert np.mean(roi) == mean
+        assert np.median(roi) == median
+        assert np.std(roi) == pytest.approx(std)
+
     def testFindActualRange(self):
         arr = np.array([1, 2, 3, 4])
         assert (-1.5, 2.5) == _get_outer_edges(arr, (-1.5, 2.5))
@@ -225,6 +225,13 @@ class _Config(dict):
         "PIPELINE_SLOW_POLICY": PipelineSlowPolicy.DROP,
         # timeout of the zmq bridge, in second
         "BRIDGE_TIMEOUT": 0.1,
+        # high water mark of the receiving zmq socket(s) connected to the
+        # bridge(s), in number of messages. It should be sized together
+        # with PIPELINE_MAX_QUEUE_SIZE for the target train rate.
+        "BRIDGE_RCVHWM": 1000,
+        # kernel receive buffer size of the zmq socket(s) connected to the
+        # bridge(s), in bytes. -1 for using the OS default.
+        "BRIDGE_RCVBUF": -1,
         # maximum length of the cache used in data correlation by train ID
         "CORRELATION_QUEUE_CACHE_SIZE": 20,
         # default extension port
@@ -85,6 +85,21 @@ class _AbstractProxy(ProcessLogger):
         """
         return self._db.execute_command('HGETALL', name)
 
+    @redis_except_handler
+    def hget_all_and_hdel(self, name, *keys):
+        """Get all key-value pairs of a hash and delete a number of its keys.
+
+        Both commands are sent in a single transaction.
+
+        :return: None if the connection failed;
+                 otherwise, a dictionary of key-value pairs before the
+                 deletion.
+        """
+        pipe = self._db.pipeline()
+        pipe.execute_command('HGETALL', name)
+        pipe.execute_command('HDEL', name, *keys)
+        return pipe.execute()[0]
+
     @redis_except_handler
     def hincrease_by(self, name, key, amount=1):
         """Increase the value of a key in a hash by the given amount.
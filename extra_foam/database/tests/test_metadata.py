@@ -67,6 +67,20 @@ class TestDataProxy(unittest.TestCase):
         self._meta.unregister_analysis(type3)
         self.assertEqual('0', self._meta.hget(Metadata.ANALYSIS_TYPE, type3))
 
+    def testHGetAllAndHDel(self):
+        name = "meta:proc:dummy"
+        self._meta.hmset(name, {'a': '1', 'reset': '1'})
+
+        self.assertDictEqual({'a': '1', 'reset': '1'},
+                             self._meta.hget_all_and_hdel(name, 'reset'))
+        self.assertDictEqual({'a': '1'}, self._meta.hget_all(name))
+
+        # key does not exist
+        self.assertDictEqual({'a': '1'},
+                             self._meta.hget_all_and_hdel(name, 'reset'))
+
+        self._meta.hdel(name, 'a')
+
     def testMetaMetadata(self):
         class Dummy(metaclass=MetaMetadata):
             DATA_SOURCE = "meta:data_source"
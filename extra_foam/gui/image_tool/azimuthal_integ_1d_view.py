@@ -34,7 +34,8 @@ class AzimuthalInteg1dPlot(PlotWidgetF):
 
     def updateF(self, data):
         """Override."""
-        momentum, intensity = data.ai.x, data.ai.y
+        ai = data.ai
+        momentum, intensity = ai.x, ai.y
 
         if intensity is None:
             return
@@ -95,11 +95,13 @@ class BulletinView(_AbstractImageToolView):
     def updateF(self, data, auto_update):
         """Override."""
         # always update automatically
+        n_pulses = data.n_pulses
+        image = data.image
         self._displayed_tid.display(data.tid)
-        self._n_total_pulses.display(data.n_pulses)
-        self._n_kept_pulses.display(data.pidx.n_kept(data.n_pulses))
-        self._dark_train_counter.display(data.image.dark_count)
-        self._n_dark_pulses.display(data.image.n_dark_pulses)
+        self._n_total_pulses.display(n_pulses)
+        self._n_kept_pulses.display(data.pidx.n_kept(n_pulses))
+        self._dark_train_counter.display(image.dark_count)
+        self._n_dark_pulses.display(image.n_dark_pulses)
 
     def _updateProcessCount(self):
         tid, n_processed, n_dropped = self._mon.get_process_count()
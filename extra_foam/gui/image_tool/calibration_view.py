@@ -68,10 +68,11 @@ class CalibrationView(_AbstractImageToolView):
     def updateF(self, data, auto_update):
         """Override."""
         if auto_update or self._corrected.image is None:
-            self._corrected.setImage(data.image.masked_mean)
-            self._dark.setImage(data.image.dark_mean)
-            self._offset.setImage(data.image.offset_mean)
-            self._gain.setImage(data.image.gain_mean)
+            image = data.image
+            self._corrected.setImage(image.masked_mean)
+            self._dark.setImage(image.dark_mean)
+            self._offset.setImage(image.offset_mean)
+            self._gain.setImage(image.gain_mean)
 
     @pyqtSlot()
     def _loadGainConst(self):
@@ -7,8 +7,6 @@ Author: Jun Zhu <jun.zhu@xfel.eu>
 Copyright (C) European X-Ray Free-Electron Laser Facility GmbH.
 All rights reserved.
 """
-from string import Template
-
 from PyQt5.QtCore import Qt, pyqtSlot
 from PyQt5.QtWidgets import (
     QHBoxLayout, QSplitter, QVBoxLayout, QWidget
@@ -61,8 +59,9 @@ class RoiHist(HistMixin, PlotWidgetF):
 
         self._plot = self.plotBar()
 
-        self._title_template = Template(
-            f"ROI Histogram (mean: $mean, median: $median, std: $std)")
+        self._title_template = (
+            "ROI Histogram (mean: {mean:.2e}, median: {median:.2e}, "
+            "std: {std:.2e})")
         self.updateTitle()
         self.setLabel('left', 'Counts')
         self.setLabel('bottom', 'Pixel value')
@@ -201,7 +201,9 @@ class MainGUI(QMainWindow):
         # *************************************************************
 
         # book-keeping opened windows
-        self._plot_windows = WeakKeyDictionary()
+        # plot windows are iterated on every plot update and they always
+        # unregister themselves when closed
+        self._plot_windows = []
         self._satellite_windows = WeakKeyDictionary()
 
         self._gui_logger = GuiLogger(parent=self)
@@ -348,18 +350,27 @@ class MainGUI(QMainWindow):
 
         try:
             processed = self._input.get()
-            self._queue.append(processed)
         except Empty:
             return
 
-        # clear the previous plots no matter what comes next
-        # for w in self._plot_windows.keys():
-        #     w.reset()
+        # only the latest data is plotted, drop the stale ones which have
+        # been queued in the meanwhile
+        n_dropped = 0
+        while True:
+            try:
+                processed = self._input.get()
+                n_dropped += 1
+            except Empty:
+                break
+        if n_dropped:
+            logger.debug("Dropped %d stale train(s) in plotting", n_dropped)
+
+        self._queue.append(processed)
 
         data = self._queue[0]
 
         self._image_tool.updateWidgetsF()
-        for w in itertools.chain(self._plot_windows):
+        for w in self._plot_windows:
             try:
                 w.updateWidgetsF()
             except Exception as e:
@@ -368,7 +379,8 @@ class MainGUI(QMainWindow):
                              + repr(e))
                 logger.error(f"[Update plots] {repr(e)}")
 
-        logger.debug(f"Plot train with ID: {data.tid}")
+        # lazy formatting since it is called on every plot update
+        logger.debug("Plot train with ID: %s", data.tid)
 
     def pingRedisServer(self):
         try:
@@ -427,10 +439,10 @@ class MainGUI(QMainWindow):
         return False
 
     def registerWindow(self, instance):
-        self._plot_windows[instance] = 1
+        self._plot_windows.append(instance)
 
     def unregisterWindow(self, instance):
-        del self._plot_windows[instance]
+        self._plot_windows.remove(instance)
 
     def registerSatelliteWindow(self, instance):
         self._satellite_windows[instance] = 1
@@ -7,16 +7,172 @@ Author: Jun Zhu <jun.zhu@xfel.eu>
 Copyright (C) European X-Ray Free-Electron Laser Facility GmbH.
 All rights reserved.
 """
-from PyQt5.QtCore import Qt, pyqtSlot, pyqtSignal
+from PyQt5.QtCore import (
+    QAbstractTableModel, QModelIndex, Qt, pyqtSlot, pyqtSignal
+)
 from PyQt5.QtWidgets import (
     QGridLayout, QHeaderView, QInputDialog, QLineEdit, QMenu, QMessageBox,
-    QPushButton, QTableWidget, QTableWidgetItem, QWidget,
+    QPushButton, QTableView, QWidget,
 )
 
 from ...database import MetaProxy
 from ...logger import logger
 
 
+class SnapshotTableModel(QAbstractTableModel):
+    """Table model interface for configuration snapshots.
+
+    Each row is a list of (name, timestamp, description).
+    """
+    # flags() and data() are called by the view for every visible cell
+    _READONLY_FLAGS = Qt.ItemIsEnabled
+    _EDITABLE_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsEditable
+    _TEXT_ROLES = frozenset((Qt.DisplayRole, Qt.EditRole))
+
+    def __init__(self, readonly_name, parent=None):
+        """Initialization.
+
+        :param str readonly_name: name of the snapshot whose description
+            is not allowed to be edited.
+        """
+        super().__init__(parent=parent)
+
+        self._readonly_name = readonly_name
+        self._rows = []
+        # lookup table which is built lazily and then kept in sync,
+        # key: name, value: # of row
+        self._name_to_row = None
+        self._headers = ("Name", "Timestamp", "Description")
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Override."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+
+    def flags(self, index):
+        """Override."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+
+        if index.column() == 2 \
+                and self._rows[index.row()][0] != self._readonly_name:
+            return self._EDITABLE_FLAGS
+        return self._READONLY_FLAGS
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Override."""
+        # Only the description is editable in the view. The name must be
+        # changed via renameSnapshot to keep the lookup table in sync.
+        if not index.isValid() or role != Qt.EditRole or index.column() != 2:
+            return False
+
+        self._rows[index.row()][2] = value
+        self.dataChanged.emit(index, index)
+        return True
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Override."""
+        if not index.isValid():
+            return
+
+        if role in self._TEXT_ROLES:
+            return self._rows[index.row()][index.column()]
+
+    def rowCount(self, parent=None, *args, **kwargs):
+        """Override."""
+        return len(self._rows)
+
+    def columnCount(self, parent=None, *args, **kwargs):
+        """Override."""
+        return len(self._headers)
+
+    def _invalidateIndex(self):
+        self._name_to_row = None
+
+    def _index(self):
+        if self._name_to_row is None:
+            self._name_to_row = {
+                cfg[0]: i for i, cfg in enumerate(self._rows)}
+        return self._name_to_row
+
+    def __contains__(self, name):
+        return name in self._index()
+
+    def rowOf(self, name):
+        """Return the row of the snapshot with the given name."""
+        return self._index()[name]
+
+    def name(self, row):
+        """Return the name of the snapshot at the given row."""
+        return self._rows[row][0]
+
+    def snapshot(self, row):
+        """Return (name, timestamp, description) at the given row."""
+        return tuple(self._rows[row])
+
+    def snapshots(self):
+        """Return a list of (name, timestamp, description) in row order."""
+        return [tuple(cfg) for cfg in self._rows]
+
+    def setupModelData(self, rows):
+        """Replace all the snapshots within a single model reset."""
+        self.beginResetModel()
+        self._rows = [list(cfg) for cfg in rows]
+        self._invalidateIndex()
+        self.endResetModel()
+
+    def insertSnapshot(self, row, cfg):
+        """Insert a snapshot at the given row."""
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, list(cfg))
+        self.endInsertRows()
+
+        index = self._name_to_row
+        if index is not None:
+            if row != len(self._rows) - 1:
+                # shift the rows after the inserted one in a single pass
+                index = {k: v + 1 if v >= row else v
+                         for k, v in index.items()}
+            index[cfg[0]] = row
+            self._name_to_row = index
+
+    def updateSnapshot(self, row, cfg):
+        """Overwrite the snapshot at the given row."""
+        name = self._rows[row][0]
+        self._rows[row] = list(cfg)
+        self.dataChanged.emit(self.index(row, 0),
+                              self.index(row, len(self._headers) - 1))
+        if cfg[0] != name:
+            self._invalidateIndex()
+
+    def removeSnapshot(self, name):
+        """Remove the snapshot with the given name."""
+        row = self.rowOf(name)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+        index = self._name_to_row
+        if row == len(self._rows):
+            del index[name]
+        else:
+            # shift the rows after the removed one in a single pass
+            self._name_to_row = {k: v - 1 if v > row else v
+                                 for k, v in index.items() if k != name}
+
+    def renameSnapshot(self, row, new_name):
+        """Rename the snapshot at the given row."""
+        name = self._rows[row][0]
+        self._rows[row][0] = new_name
+        idx = self.index(row, 0)
+        self.dataChanged.emit(idx, idx)
+
+        index = self._name_to_row
+        if index is not None:
+            del index[name]
+            index[new_name] = row
+
+
 class Configurator(QWidget):
 
     load_metadata_sgn = pyqtSignal()
@@ -27,7 +183,9 @@ class Configurator(QWidget):
     def __init__(self):
         super().__init__()
 
-        self._table = QTableWidget()
+        self._model = SnapshotTableModel(self.LAST_SAVED)
+        self._table = QTableView()
+        self._table.setModel(self._model)
         self._table.setContextMenuPolicy(Qt.CustomContextMenu)
 
         self._snapshot_btn = QPushButton("Take snapshot")
@@ -36,15 +194,12 @@ class Configurator(QWidget):
         self._load_cfg_btn = QPushButton("Load setups from file")
 
         self._meta = MetaProxy()
-        self._config = dict()  # key: name, value: # of row
 
         self.initUI()
         self.initConnections()
 
     def initUI(self):
         table = self._table
-        table.setColumnCount(3)
-        table.setHorizontalHeaderLabels(['Name', 'Timestamp', 'Description'])
 
         header = table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Interactive)
@@ -62,7 +217,7 @@ class Configurator(QWidget):
     def initConnections(self):
         self._snapshot_btn.clicked.connect(lambda x: self._takeSnapshot())
         self._reset_btn.clicked.connect(self._resetToDefault)
-        self._table.itemDoubleClicked.connect(self.onItemDoubleClicked)
+        self._table.doubleClicked.connect(self.onItemDoubleClicked)
         self._table.customContextMenuRequested.connect(self.showContextMenu)
         self._save_cfg_btn.clicked.connect(self._askSaveConfiguration)
         self._load_cfg_btn.clicked.connect(self._askLoadConfiguration)
@@ -87,6 +242,18 @@ class Configurator(QWidget):
         self._save_cfg_btn.setEnabled(True)
         self._load_cfg_btn.setEnabled(True)
 
+    def _validateConfiguration(self, cfg):
+        """Return a copy of cfg with invalid values replaced."""
+        validated = []
+        for col, text in enumerate(cfg):
+            if not isinstance(text, str):
+                # I hope it will not happen in real life.
+                logger.error(f"TypeError: Invalid value {text} for column "
+                             f"{col+1} in Configurator!")
+                text = " "
+            validated.append(text)
+        return validated
+
     def _insertConfigurationToList(self, cfg, row=None):
         """Insert a row for the new configuration.
 
@@ -95,79 +262,43 @@ class Configurator(QWidget):
         :param list/tuple cfg: (name, timestamp, description) of the
             configuration.
         """
-        table = self._table
+        model = self._model
 
         if cfg[0] == self.LAST_SAVED:
             row = 0
         elif row is None:
-            row = table.rowCount()
-
-        table.insertRow(row)
-        for col, text in zip(range(table.columnCount()), cfg):
-            item = QTableWidgetItem()
-            table.setItem(row, col, item)
-            flag = Qt.ItemIsEnabled
-            if cfg[0] != self.LAST_SAVED and col == 2:
-                flag |= Qt.ItemIsEditable
-            item.setFlags(flag)
-            try:
-                item.setText(text)
-            except TypeError:
-                # I hope it will not happen in real life.
-                item.setText(" ")
-                logger.error(f"TypeError: Invalid value {text} for column "
-                             f"{col+1} in Configurator!")
-
-        if row != len(self._config):
-            # adjust the row indices for the other configurations
-            for k, v in self._config.items():
-                if v >= row:
-                    self._config[k] += 1
+            row = model.rowCount()
 
-        self._config[cfg[0]] = row
+        model.insertSnapshot(row, self._validateConfiguration(cfg))
 
     def _removeConfigurationFromList(self, name):
         """Remove a row from the table and configuration list.
 
         :param str name: name of the configuration.
         """
-        row = self._config[name]
-        del self._config[name]
-        self._table.removeRow(row)
-
-        if row != len(self._config):
-            # adjust the row indices for the other configurations
-            for k, v in self._config.items():
-                if v > row:
-                    self._config[k] -= 1
+        self._model.removeSnapshot(name)
 
     def _copyConfiguration(self, row, new_name):
         """Copy a row and insert the new one at the end of the table."""
-        cfg = [self._table.item(row, i).text()
-               for i in range(self._table.columnCount())]
+        name, timestamp, description = self._model.snapshot(row)
 
-        self._meta.copy_snapshot(cfg[0], new_name)
-        cfg[0] = new_name
-        self._insertConfigurationToList(cfg)
+        self._meta.copy_snapshot(name, new_name)
+        self._insertConfigurationToList((new_name, timestamp, description))
 
     def _removeConfiguration(self, row):
         """Remove a row of configuration."""
-        table = self._table
-        name = table.item(row, 0).text()
+        name = self._model.name(row)
 
         self._meta.remove_snapshot(name)
         self._removeConfigurationFromList(name)
 
     def _renameConfiguration(self, row, new_name):
         """Rename a row of configuration."""
-        table = self._table
-        name = table.item(row, 0).text()
+        model = self._model
+        name = model.name(row)
 
         self._meta.rename_snapshot(name, new_name)
-
-        del self._config[name]
-        self._config[new_name] = row
-        table.item(row, 0).setText(new_name)
+        model.renameSnapshot(row, new_name)
 
     def _askSaveConfiguration(self):
         reply = QMessageBox.question(
@@ -180,12 +311,9 @@ class Configurator(QWidget):
 
     def _saveConfigurations(self):
         """Save all configurations to file."""
-        table = self._table
-        sorted_config = sorted(self._config.items(), key=lambda x: x[1])
-        lst = []
-        for name, row in sorted_config:
-            # "description" was not saved in Redis when edited in the table
-            lst.append((name, table.item(row, 2).text()))
+        # "description" was not saved in Redis when edited in the table
+        lst = [(name, description)
+               for name, _, description in self._model.snapshots()]
         self._meta.dump_configurations(lst)
 
     def _askLoadConfiguration(self):
@@ -200,49 +328,51 @@ class Configurator(QWidget):
 
     def _loadConfigurations(self):
         """Load configurations from file."""
-        cfg_list = self._meta.load_configurations()
-
-        for cfg in cfg_list:
-            # 'self._meta.load_configurations' has already
-            # write all the configurations into Redis.
-            if cfg[0] in self._config:
-                self._removeConfigurationFromList(cfg[0])
-
-        for cfg in cfg_list:
-            self._insertConfigurationToList(cfg)
-
-        if self.LAST_SAVED not in self._config:
-            self._takeSnapshot()
+        # 'self._meta.load_configurations' has already
+        # write all the configurations into Redis.
+        cfg_list = [self._validateConfiguration(cfg)
+                    for cfg in self._meta.load_configurations()]
+        loaded = {cfg[0] for cfg in cfg_list}
+
+        # Assemble all the rows first and then populate the table at once.
+        # "Last saved" is always in the first row.
+        rows = [cfg for cfg in cfg_list if cfg[0] == self.LAST_SAVED]
+        rows.extend(cfg for cfg in self._model.snapshots()
+                    if cfg[0] not in loaded)
+        if not rows or rows[0][0] != self.LAST_SAVED:
+            rows.insert(0, self._validateConfiguration(
+                self._meta.take_snapshot(self.LAST_SAVED)))
+        rows.extend(cfg for cfg in cfg_list if cfg[0] != self.LAST_SAVED)
+
+        self._model.setupModelData(rows)
 
     def _takeSnapshot(self):
         """Take a snapshot of the current configuration."""
-        table = self._table
+        model = self._model
         cfg = self._meta.take_snapshot(self.LAST_SAVED)
 
-        if table.rowCount() == 0 or table.item(0, 0).text() != self.LAST_SAVED:
+        if model.rowCount() == 0 or model.name(0) != self.LAST_SAVED:
             self._insertConfigurationToList(cfg, 0)
         else:
-            for i, text in zip(range(table.columnCount()), cfg):
-                table.item(0, i).setText(text)
+            model.updateSnapshot(0, self._validateConfiguration(cfg))
 
     def _resetToDefault(self):
         self._meta.load_snapshot(self.DEFAULT)
         self.load_metadata_sgn.emit()
 
-    def onItemDoubleClicked(self, item):
+    def onItemDoubleClicked(self, index):
         """Double-click the name to set the configuration."""
-        if self._table.column(item) < 2:
-            self._meta.load_snapshot(item.text())
+        if index.isValid() and index.column() < 2:
+            self._meta.load_snapshot(index.data())
             self.load_metadata_sgn.emit()
 
     def showContextMenu(self, pos):
-        table = self._table
-        item = table.itemAt(pos)
-        if table.column(item) != 0:
+        index = self._table.indexAt(pos)
+        if not index.isValid() or index.column() != 0:
             # show context menu only when right-clicking on the name
             return
 
-        row = self._table.row(item)
+        row = index.row()
         menu = QMenu()
         copy_action = menu.addAction("Copy snapshot")
         if row != 0:
@@ -277,7 +407,7 @@ class Configurator(QWidget):
                     self._renameConfiguration(row, new_name)
 
     def _checkConfigName(self, name):
-        if name in self._config:
+        if name in self._model:
             logger.error(f"Configuration '{name}' already exists!")
             return False
 
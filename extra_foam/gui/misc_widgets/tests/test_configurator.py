@@ -21,54 +21,74 @@ class TestConfigurator(unittest.TestCase):
 
     def testAddCopyRemoveConfiguration(self):
         widget = self._widget
-        table = widget._table
+        model = widget._model
 
-        self.assertEqual(1, table.rowCount())
-        self.assertEqual(widget.LAST_SAVED, table.item(0, 0).text())
-        self.assertEqual("2020-01-01 01:01:01", table.item(0, 1).text())
-        self.assertEqual("", table.item(0, 2).text())
+        self.assertEqual(1, model.rowCount())
+        self.assertEqual(widget.LAST_SAVED, model.data(model.index(0, 0)))
+        self.assertEqual("2020-01-01 01:01:01", model.data(model.index(0, 1)))
+        self.assertEqual("", model.data(model.index(0, 2)))
 
         # test add
 
         cfg = ["abc", "2020-02-02 02:02:02", "abc setup"]
         widget._insertConfigurationToList(cfg)
-        self.assertEqual("abc", table.item(1, 0).text())
-        self.assertEqual("2020-02-02 02:02:02", table.item(1, 1).text())
-        self.assertEqual("abc setup", table.item(1, 2).text())
-        self.assertDictEqual({widget.LAST_SAVED: 0, 'abc': 1}, widget._config)
+        self.assertEqual("abc", model.data(model.index(1, 0)))
+        self.assertEqual("2020-02-02 02:02:02", model.data(model.index(1, 1)))
+        self.assertEqual("abc setup", model.data(model.index(1, 2)))
+        self.assertDictEqual({widget.LAST_SAVED: 0, 'abc': 1}, model._index())
+        # only the description of user-defined configurations is editable
+        self.assertFalse(model.flags(model.index(0, 2)) & Qt.ItemIsEditable)
+        self.assertFalse(model.flags(model.index(1, 0)) & Qt.ItemIsEditable)
+        self.assertTrue(model.flags(model.index(1, 2)) & Qt.ItemIsEditable)
+        # name cannot be changed via setData
+        self.assertFalse(model.setData(model.index(1, 0), "xyz", Qt.EditRole))
+        self.assertTrue(model.setData(model.index(1, 2), "new setup", Qt.EditRole))
+        self.assertEqual("new setup", model.data(model.index(1, 2)))
 
         # test copy
 
         widget._copyConfiguration(1, "efg")
-        self.assertDictEqual({widget.LAST_SAVED: 0, 'abc': 1, 'efg': 2}, widget._config)
+        self.assertEqual("new setup", model.data(model.index(2, 2)))
+        self.assertDictEqual({widget.LAST_SAVED: 0, 'abc': 1, 'efg': 2}, model._index())
 
         # test remove
 
         widget._removeConfiguration(1)
-        self.assertEqual("efg", table.item(1, 0).text())
-        self.assertEqual("2020-02-02 02:02:02", table.item(1, 1).text())
-        self.assertEqual("abc setup", table.item(1, 2).text())
-        self.assertDictEqual({widget.LAST_SAVED: 0, 'efg': 1}, widget._config)
+        self.assertEqual("efg", model.data(model.index(1, 0)))
+        self.assertEqual("2020-02-02 02:02:02", model.data(model.index(1, 1)))
+        self.assertEqual("new setup", model.data(model.index(1, 2)))
+        self.assertDictEqual({widget.LAST_SAVED: 0, 'efg': 1}, model._index())
         self._widget._meta.remove_snapshot.assert_called_with('abc')
 
         widget._removeConfiguration(1)
-        self.assertDictEqual({widget.LAST_SAVED: 0}, widget._config)
+        self.assertDictEqual({widget.LAST_SAVED: 0}, model._index())
         self._widget._meta.remove_snapshot.assert_called_with('efg')
 
+    def testInsertConfigurationInTheMiddle(self):
+        widget = self._widget
+        model = widget._model
+
+        widget._insertConfigurationToList(["abc", "2020-02-02 02:02:02", "abc setup"])
+        widget._insertConfigurationToList(["efg", "2020-03-03 03:03:03", "efg setup"], 1)
+        self.assertEqual("efg", model.name(1))
+        self.assertEqual("abc", model.name(2))
+        self.assertDictEqual({widget.LAST_SAVED: 0, 'efg': 1, 'abc': 2}, model._index())
+
     def testRenameConfiguration(self):
         widget = self._widget
-        table = widget._table
+        model = widget._model
 
         cfg = ["efg", "2020-03-03 03:03:03", "efg setup"]
         widget._insertConfigurationToList(cfg)
         widget._renameConfiguration(1, "abc")
         widget._meta.rename_snapshot.assert_called_with('efg', 'abc')
-        self.assertEqual("abc", table.item(1, 0).text())
-        self.assertDictEqual({widget.LAST_SAVED: 0, 'abc': 1}, widget._config)
+        self.assertEqual("abc", model.data(model.index(1, 0)))
+        self.assertDictEqual({widget.LAST_SAVED: 0, 'abc': 1}, model._index())
 
     def testSetConfiguration(self):
         widget = self._widget
         table = widget._table
+        model = widget._model
         spy = QSignalSpy(widget.load_metadata_sgn)
         spy_count = 0
 
@@ -77,12 +97,12 @@ class TestConfigurator(unittest.TestCase):
 
         for row in range(2):
             for i in range(2):
-                table.itemDoubleClicked.emit(table.item(row, i))
-                widget._meta.load_snapshot.assert_called_with(table.item(row, i).text())
+                table.doubleClicked.emit(model.index(row, i))
+                widget._meta.load_snapshot.assert_called_with(model.data(model.index(row, i)))
                 widget._meta.load_snapshot.reset_mock()
                 spy_count += 1
                 self.assertEqual(spy_count, len(spy))
-            table.itemDoubleClicked.emit(table.item(row, 2))
+            table.doubleClicked.emit(model.index(row, 2))
             widget._meta.load_snapshot.assert_not_called()
             self.assertEqual(spy_count, len(spy))
 
@@ -94,7 +114,7 @@ class TestConfigurator(unittest.TestCase):
 
     def testSaveLoad(self):
         widget = self._widget
-        table = widget._table
+        model = widget._model
 
         widget._insertConfigurationToList(["abc", "2020-02-02 02:02:02", "abc setup"])
         widget._insertConfigurationToList(["efg", "2020-03-03 03:03:03", "efg setup"])
@@ -122,12 +142,33 @@ class TestConfigurator(unittest.TestCase):
             widget._load_cfg_btn.clicked.emit()
             widget._meta.load_configurations.assert_called_once()
 
-        self.assertEqual(3, table.rowCount())
-        self.assertEqual(widget.LAST_SAVED, table.item(0, 0).text())
-        self.assertEqual("2020-02-13 04:04:04", table.item(0, 1).text())
-        self.assertEqual("abc", table.item(1, 0).text())
-        self.assertEqual("2020-02-12 02:02:02", table.item(1, 1).text())
-        self.assertEqual("abc setup 1", table.item(1, 2).text())
-        self.assertEqual("efg", table.item(2, 0).text())
-        self.assertEqual("2020-03-13 03:03:03", table.item(2, 1).text())
-        self.assertEqual("efg setup 1", table.item(2, 2).text())
+        self.assertEqual(3, model.rowCount())
+        self.assertEqual(widget.LAST_SAVED, model.data(model.index(0, 0)))
+        self.assertEqual("2020-02-13 04:04:04", model.data(model.index(0, 1)))
+        self.assertEqual("abc", model.data(model.index(1, 0)))
+        self.assertEqual("2020-02-12 02:02:02", model.data(model.index(1, 1)))
+        self.assertEqual("abc setup 1", model.data(model.index(1, 2)))
+        self.assertEqual("efg", model.data(model.index(2, 0)))
+        self.assertEqual("2020-03-13 03:03:03", model.data(model.index(2, 1)))
+        self.assertEqual("efg setup 1", model.data(model.index(2, 2)))
+
+    def testLoadKeepsNonConflictingConfigurations(self):
+        widget = self._widget
+        model = widget._model
+
+        widget._insertConfigurationToList(["abc", "2020-02-02 02:02:02", "abc setup"])
+        widget._insertConfigurationToList(["xyz", "2020-04-04 04:04:04", "xyz setup"])
+
+        widget._meta.load_configurations.return_value = [
+            ("abc", "2020-02-12 02:02:02", "abc setup 1"),
+            (widget.LAST_SAVED, "2020-02-13 04:04:04", ""),
+        ]
+        widget._loadConfigurations()
+
+        self.assertListEqual([
+            (widget.LAST_SAVED, "2020-02-13 04:04:04", ""),
+            ("xyz", "2020-04-04 04:04:04", "xyz setup"),
+            ("abc", "2020-02-12 02:02:02", "abc setup 1"),
+        ], model.snapshots())
+        self.assertDictEqual({widget.LAST_SAVED: 0, 'xyz': 1, 'abc': 2},
+                             model._index())
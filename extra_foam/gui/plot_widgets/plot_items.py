@@ -251,6 +251,27 @@ class RectROI(pg.ROI):
         self.addScaleHandle([1, 1], [0, 0])
 
 
+class PlotDataItem(pg.PlotDataItem):
+    """PlotDataItem which also accepts data with less than two points.
+
+    Downsampling and clipping to view in pg.PlotDataItem derive the sample
+    spacing from the first and the last points.
+    """
+    def getData(self):
+        """Override."""
+        if self.xDisp is None and self.xData is not None \
+                and len(self.xData) < 2:
+            opts = self.opts
+            auto, clip = opts['autoDownsample'], opts['clipToView']
+            opts['autoDownsample'] = opts['clipToView'] = False
+            try:
+                return super().getData()
+            finally:
+                opts['autoDownsample'], opts['clipToView'] = auto, clip
+
+        return super().getData()
+
+
 class CurvePlotItem(pg.GraphicsObject):
     """CurvePlotItem."""
 
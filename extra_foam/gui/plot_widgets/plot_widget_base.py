@@ -8,6 +8,10 @@ Copyright (C) European X-Ray Free-Electron Laser Facility GmbH.
 All rights reserved.
 """
 import abc
+import sys
+import time
+import traceback
+from weakref import WeakSet
 
 import numpy as np
 
@@ -17,11 +21,63 @@ from PyQt5.QtWidgets import QSizePolicy
 from .. import pyqtgraph as pg
 
 from .plot_items import (
-    BarGraphItem, CurvePlotItem, StatisticsBarItem
+    BarGraphItem, CurvePlotItem, PlotDataItem, StatisticsBarItem
 )
 from ..misc_widgets import FColor
 from ...config import config
+from ...logger import logger
 from ...typing import final
+from ...utils import profiler, PROFILER_ENABLED
+
+
+class _PlotPerfCounter:
+    """Per-widget counters of the time spent on setting data and painting.
+
+    The accumulated numbers are logged at most once per interval.
+    """
+    _LOG_INTERVAL = 1.0  # in s
+
+    def __init__(self, name):
+        self._name = name
+        self._t_logged = time.perf_counter()
+        self._reset()
+
+    def _reset(self):
+        self._n_set_data = 0
+        self._n_points = 0
+        self._set_data_ms = 0.
+        self._n_paints = 0
+        self._paint_ms = 0.
+
+    def timeSetData(self, f):
+        """Return the given setData method with timing."""
+        def timed_f(*args, **kwargs):
+            t0 = time.perf_counter()
+            result = f(*args, **kwargs)
+            self._set_data_ms += 1000 * (time.perf_counter() - t0)
+            self._n_set_data += 1
+            x = args[0] if args else kwargs.get('x')
+            self._n_points += 0 if x is None else len(x)
+            self._log()
+            return result
+        return timed_f
+
+    def addPaint(self, dt):
+        """Add the time (in s) spent on a paint event."""
+        self._paint_ms += 1000 * dt
+        self._n_paints += 1
+        self._log()
+
+    def _log(self):
+        now = time.perf_counter()
+        if now - self._t_logged < self._LOG_INTERVAL:
+            return
+
+        logger.debug(f"[{self._name}] {self._n_points} points in "
+                     f"{self._n_set_data} setData: {self._set_data_ms:.3f} ms, "
+                     f"{self._n_paints} paints: {self._paint_ms:.3f} ms")
+        self._t_logged = now
+        self._reset()
 
 
 class PlotWidgetF(pg.GraphicsView):
@@ -38,6 +94,11 @@ class PlotWidgetF(pg.GraphicsView):
     sigRangeChanged = pyqtSignal(object, object)
     sigTransformChanged = pyqtSignal(object)
 
+    # types of the items whose data can be cleared by 'setData([], [])'
+    _RESETTABLE_TYPES = (pg.PlotCurveItem, pg.ScatterPlotItem,
+                         PlotDataItem, BarGraphItem, CurvePlotItem,
+                         StatisticsBarItem)
+
     def __init__(self, parent=None, *,
                  background='default', show_indicator=False, **kargs):
         """Initialization."""
@@ -53,8 +114,21 @@ class PlotWidgetF(pg.GraphicsView):
 
         self._title = ""
 
+        # only available when profiling is enabled
+        self._perf = _PlotPerfCounter(type(self).__name__) \
+            if PROFILER_ENABLED else None
+
+        # items in the PlotItem which will be cleared in reset()
+        self._resettable_items = []
+        # cached bound 'setData' methods of the above items
+        self._reset_fns = None
+
         # pg.PlotItem is a QGraphicsWidget
         self._plot_item = pg.PlotItem(**kargs)
+        # Curves with many more points than pixels are reduced to their
+        # envelope and only the points within the visible range are drawn.
+        self._plot_item.setDownsampling(auto=True, mode='peak')
+        self._plot_item.setClipToView(True)
         # set 'centralWidget' for GraphicsView and add the item to
         # GraphicsScene
         self.setCentralItem(self._plot_item)
@@ -64,6 +138,9 @@ class PlotWidgetF(pg.GraphicsView):
             self._v_line = pg.InfiniteLine(angle=90, movable=False)
             self._h_line = pg.InfiniteLine(angle=0, movable=False)
             self._indicator = pg.TextItem(color=FColor.k)
+            # last handled mouse position (in pixel) and indicator text
+            self._last_mouse_pos = None
+            self._indicator_text = ""
             self._v_line.hide()
             self._h_line.hide()
             self._indicator.hide()
@@ -85,15 +162,16 @@ class PlotWidgetF(pg.GraphicsView):
         plot_item = self._plot_item
         for i in plot_item.items[:]:
             plot_item.removeItem(i)
+        self._resettable_items.clear()
+        self._reset_fns = None
 
     def reset(self):
         """Clear the data of all the items in the PlotItem object."""
-        for item in self._plot_item.items:
-            try:
-                item.setData([], [])
-            except TypeError:
-                # FIXME: better solution
-                pass
+        if self._reset_fns is None:
+            self._reset_fns = tuple(
+                item.setData for item in self._resettable_items)
+        for set_data in self._reset_fns:
+            set_data([], [])
 
     @abc.abstractmethod
     def updateF(self, data):
@@ -106,21 +184,35 @@ class PlotWidgetF(pg.GraphicsView):
         self.setParent(None)
         super().close()
 
-    def addItem(self, *args, **kwargs):
+    def addItem(self, item, *args, **kwargs):
         """Explicitly call PlotItem.addItem.
 
         This method must be here to override the addItem method in
         GraphicsView. Otherwise, people may misuse the addItem method.
         """
-        self._plot_item.addItem(*args, **kwargs)
-
-    def removeItem(self, *args, **kwargs):
-        self._plot_item.removeItem(*args, **kwargs)
+        self._plot_item.addItem(item, *args, **kwargs)
+        if isinstance(item, self._RESETTABLE_TYPES):
+            if self._perf is not None:
+                item.setData = self._perf.timeSetData(item.setData)
+            self._resettable_items.append(item)
+            self._reset_fns = None
+
+    def removeItem(self, item, *args, **kwargs):
+        self._plot_item.removeItem(item, *args, **kwargs)
+        try:
+            self._resettable_items.remove(item)
+            self._reset_fns = None
+        except ValueError:
+            pass
 
     def plotCurve(self, *args, **kwargs):
-        """Add and return a new curve plot."""
-        item = pg.PlotCurveItem(*args, **kwargs)
-        self._plot_item.addItem(item)
+        """Add and return a new curve plot.
+
+        A PlotDataItem is used since downsampling and clipping to view are
+        only supported by it.
+        """
+        item = PlotDataItem(*args, **kwargs)
+        self.addItem(item)
         return item
 
     def plotScatter(self, *args, **kwargs):
@@ -128,7 +220,7 @@ class PlotWidgetF(pg.GraphicsView):
         if 'pen' not in kwargs:
             kwargs['pen'] = FColor.mkPen(None)
         item = pg.ScatterPlotItem(*args, **kwargs)
-        self._plot_item.addItem(item)
+        self.addItem(item)
         return item
 
     def plotBar(self, x=None, y=None, width=1.0, y2=False, **kwargs):
@@ -140,7 +232,7 @@ class PlotWidgetF(pg.GraphicsView):
                 self.createY2()
             self._vb2.addItem(item)
         else:
-            self._plot_item.addItem(item)
+            self.addItem(item)
 
         return item
 
@@ -153,7 +245,7 @@ class PlotWidgetF(pg.GraphicsView):
                 self.createY2()
             self._vb2.addItem(item)
         else:
-            self._plot_item.addItem(item)
+            self.addItem(item)
 
         return item
 
@@ -211,6 +303,11 @@ class PlotWidgetF(pg.GraphicsView):
 
     def onMouseMoved(self, ev):
         pos = ev[0]
+        pos_px = (int(pos.x()), int(pos.y()))
+        if pos_px == self._last_mouse_pos:
+            return
+        self._last_mouse_pos = pos_px
+
         y_shift = 45  # move text to the top of the mouse cursor
         self._indicator.setPos(pos.x(), pos.y() - y_shift)
 
@@ -219,7 +316,17 @@ class PlotWidgetF(pg.GraphicsView):
         self._v_line.setPos(x)
         self._h_line.setPos(y)
 
-        self._indicator.setText(f"x={x}\ny={y}")
+        text = f"x={x}\ny={y}"
+        if text != self._indicator_text:
+            self._indicator_text = text
+            self._indicator.setText(text)
+
+    if PROFILER_ENABLED:
+        def paintEvent(self, ev):
+            """Override."""
+            t0 = time.perf_counter()
+            super().paintEvent(ev)
+            self._perf.addPaint(time.perf_counter() - t0)
 
     def enterEvent(self, ev):
         """Override."""
@@ -234,6 +341,7 @@ class PlotWidgetF(pg.GraphicsView):
             self._v_line.hide()
             self._h_line.hide()
             self._indicator.hide()
+            self._last_mouse_pos = None
 
     def closeEvent(self, QCloseEvent):
         parent = self.parent()
@@ -243,23 +351,72 @@ class PlotWidgetF(pg.GraphicsView):
 
 
 class TimedPlotWidgetF(PlotWidgetF):
+    # A single timer, which only runs when at least one widget is shown,
+    # drives the refresh of all the shown widgets.
+    _shared_timer = None
+    _shown_widgets = WeakSet()
+
     def __init__(self, *args, **kwargs):
         """Initialization."""
         super().__init__(*args, **kwargs)
 
         self._data = None
-
-        self._timer = QTimer()
-        self._timer.timeout.connect(self._refresh_imp)
-        self._timer.start(config["GUI_PLOT_WITH_STATE_UPDATE_TIMER"])
+        # the data used in the last refresh
+        self._refreshed_data = None
 
     @abc.abstractmethod
     def refresh(self):
         pass
 
+    @classmethod
+    @profiler("Refresh timed plots", process_time=True)
+    def _refreshAll(cls):
+        for widget in list(cls._shown_widgets):
+            # a failing widget must not stop the others from refreshing
+            try:
+                widget._refresh_imp()
+            except Exception as e:
+                exc_type, exc_value, exc_traceback = sys.exc_info()
+                logger.debug(repr(traceback.format_tb(exc_traceback))
+                             + repr(e))
+                logger.error(f"[Refresh plots] {repr(e)}")
+
+    def reset(self):
+        """Override."""
+        super().reset()
+        # redraw the data on the next refresh
+        self._refreshed_data = None
+
+    def showEvent(self, ev):
+        """Override."""
+        # the data may have changed while the widget was hidden
+        self._refreshed_data = None
+        cls = TimedPlotWidgetF
+        cls._shown_widgets.add(self)
+        if cls._shared_timer is None:
+            cls._shared_timer = QTimer()
+            cls._shared_timer.timeout.connect(cls._refreshAll)
+        if not cls._shared_timer.isActive():
+            cls._shared_timer.start(
+                config["GUI_PLOT_WITH_STATE_UPDATE_TIMER"])
+        super().showEvent(ev)
+
+    def hideEvent(self, ev):
+        """Override."""
+        cls = TimedPlotWidgetF
+        cls._shown_widgets.discard(self)
+        if not cls._shown_widgets and cls._shared_timer is not None:
+            cls._shared_timer.stop()
+        super().hideEvent(ev)
+
     def _refresh_imp(self):
-        if self._data is not None:
+        data = self._data
+        # Data is never modified in place after leaving the pipeline, so
+        # there is nothing to refresh if no new data has arrived.
+        if data is not None and data is not self._refreshed_data \
+                and self.isVisible():
             self.refresh()
+            self._refreshed_data = data
 
     @final
     def updateF(self, data):
@@ -268,9 +425,14 @@ class TimedPlotWidgetF(PlotWidgetF):
 
 
 class HistMixin:
+    """Mixin for histogram plots.
+
+    The subclass must define '_title_template' as a format string with
+    the fields 'mean', 'median' and 'std'.
+    """
     def updateTitle(self, mean=np.nan, median=np.nan, std=np.nan):
-        self.setTitle(self._title_template.substitute(
-            mean=f"{mean:.2e}", median=f"{median:.2e}", std=f"{std:.2e}"))
+        self.setTitle(self._title_template.format(
+            mean=mean, median=median, std=std))
 
     def reset(self):
         super().reset()
@@ -1,10 +1,14 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 
-from extra_foam.gui import mkQApp
-from extra_foam.gui.plot_widgets.plot_widget_base import PlotWidgetF, TimedPlotWidgetF
+from PyQt5.QtCore import QPointF
+
+from extra_foam.gui import mkQApp, pyqtgraph as pg
+from extra_foam.gui.plot_widgets.plot_widget_base import (
+    _PlotPerfCounter, PlotWidgetF, TimedPlotWidgetF
+)
 from extra_foam.logger import logger
 
 
@@ -24,25 +28,84 @@ class TestPlotWidget(unittest.TestCase):
         self._widget.plotStatisticsBar()
 
         self.assertEqual(len(self._widget._plot_item.items), 4)
+        self.assertEqual(len(self._widget._resettable_items), 4)
 
         self._widget.clear()
         self.assertFalse(self._widget._plot_item.items)
+        self.assertFalse(self._widget._resettable_items)
+
+    def testReset(self):
+        widget = PlotWidgetF(show_indicator=True)
+        curve = widget.plotCurve([1, 2], [3, 4])
+        scatter = widget.plotScatter([1, 2], [3, 4])
+        line = pg.InfiniteLine()
+        widget.addItem(line)
+        self.assertListEqual([curve, scatter], widget._resettable_items)
+
+        # items without 'setData(x, y)' are skipped
+        widget.reset()
+        self.assertEqual(0, len(curve.xData))
+        self.assertEqual(0, len(scatter.data))
+
+        widget.removeItem(curve)
+        widget.removeItem(line)
+        self.assertListEqual([scatter], widget._resettable_items)
+        self.assertIsNone(widget._reset_fns)
+
+        curve.setData([1, 2], [3, 4])
+        widget.reset()
+        self.assertEqual(1, len(widget._reset_fns))
+        # removed item is not reset
+        self.assertEqual(2, len(curve.xData))
 
     def testCurvePlot(self):
         plot = self._widget.plotCurve(np.arange(3), np.arange(1, 4, 1))
         app.processEvents()
+        self.assertTrue(plot.opts['autoDownsample'])
+        self.assertEqual('peak', plot.opts['downsampleMethod'])
+        self.assertTrue(plot.opts['clipToView'])
 
         # test set empty data
         plot.setData([], [])
         app.processEvents()
+        self.assertEqual(0, len(plot.getData()[0]))
 
         plot.setData([1], [1])
         app.processEvents()
+        np.testing.assert_array_equal([1], plot.getData()[0])
+        # the options are kept for the following data
+        self.assertTrue(plot.opts['autoDownsample'])
+        self.assertTrue(plot.opts['clipToView'])
 
         # test if x and y have different lengths
         with self.assertRaises(Exception):
             plot.setData([1, 2, 3], [])
 
+    def testPerfCounter(self):
+        counter = _PlotPerfCounter("widget")
+        set_data = MagicMock(return_value=1)
+        timed_set_data = counter.timeSetData(set_data)
+
+        with patch("extra_foam.gui.plot_widgets.plot_widget_base.logger.debug") as debug:
+            self.assertEqual(1, timed_set_data([1, 2, 3], [4, 5, 6]))
+            set_data.assert_called_once_with([1, 2, 3], [4, 5, 6])
+            timed_set_data(x=[1, 2])
+            counter.addPaint(0.001)
+            # not logged within the interval
+            debug.assert_not_called()
+            self.assertEqual(2, counter._n_set_data)
+            self.assertEqual(5, counter._n_points)
+            self.assertEqual(1, counter._n_paints)
+
+            counter._t_logged -= counter._LOG_INTERVAL
+            counter.addPaint(0.001)
+            debug.assert_called_once()
+            self.assertIn("5 points in 2 setData", debug.call_args[0][0])
+            self.assertIn("2 paints", debug.call_args[0][0])
+            # counters are reset after logging
+            self.assertEqual(0, counter._n_set_data)
+            self.assertEqual(0, counter._n_paints)
+
     def testBarPlot(self):
         # set any valid number
         plot = self._widget.plotBar([1, 2], [3, 4])
@@ -78,6 +141,22 @@ class TestPlotWidget(unittest.TestCase):
             plot.setData([1, 2, 3], [1, 2, 3], y_min=[0, 0, 0], y_max=[2, 2])
 
 
+    def testMouseMovedIndicator(self):
+        widget = PlotWidgetF(show_indicator=True)
+        widget._indicator.setText = MagicMock()
+
+        widget.onMouseMoved((QPointF(10.2, 20.3),))
+        widget._indicator.setText.assert_called_once()
+        widget._indicator.setText.reset_mock()
+
+        # same pixel position
+        widget.onMouseMoved((QPointF(10.7, 20.9),))
+        widget._indicator.setText.assert_not_called()
+
+        widget.onMouseMoved((QPointF(11.2, 20.3),))
+        widget._indicator.setText.assert_called_once()
+
+
 class TestTimedPlotWidgetF(unittest.TestCase):
     def testUpdate(self):
         widget = TimedPlotWidgetF()
@@ -88,5 +167,77 @@ class TestTimedPlotWidgetF(unittest.TestCase):
         widget.refresh.assert_not_called()
 
         widget.updateF(1)
+        # not refreshed when invisible
+        widget._refresh_imp()
+        widget.refresh.assert_not_called()
+
+        widget.show()
+        widget._refresh_imp()
+        widget.refresh.assert_called_once()
+        # not refreshed again without new data
         widget._refresh_imp()
         widget.refresh.assert_called_once()
+        widget.updateF(2)
+        widget._refresh_imp()
+        self.assertEqual(2, widget.refresh.call_count)
+        # refreshed again after reset
+        widget.reset()
+        widget._refresh_imp()
+        self.assertEqual(3, widget.refresh.call_count)
+        # refreshed again after being shown
+        widget.hide()
+        widget.show()
+        widget._refresh_imp()
+        self.assertEqual(4, widget.refresh.call_count)
+        widget.close()
+
+    def testSharedTimer(self):
+        widget1 = TimedPlotWidgetF()
+        widget2 = TimedPlotWidgetF()
+        for w in (widget1, widget2):
+            w.refresh = MagicMock()
+            w.updateF(1)
+        self.assertNotIn(widget1, TimedPlotWidgetF._shown_widgets)
+
+        widget1.show()
+        widget2.show()
+        timer = TimedPlotWidgetF._shared_timer
+        self.assertTrue(timer.isActive())
+        TimedPlotWidgetF._refreshAll()
+        widget1.refresh.assert_called_once()
+        widget2.refresh.assert_called_once()
+
+        widget1.hide()
+        self.assertNotIn(widget1, TimedPlotWidgetF._shown_widgets)
+        self.assertTrue(timer.isActive())
+        for w in (widget1, widget2):
+            w.updateF(2)
+        TimedPlotWidgetF._refreshAll()
+        widget1.refresh.assert_called_once()
+        self.assertEqual(2, widget2.refresh.call_count)
+
+        widget2.hide()
+        self.assertFalse(timer.isActive())
+
+        widget1.show()
+        self.assertIs(timer, TimedPlotWidgetF._shared_timer)
+        self.assertTrue(timer.isActive())
+        widget1.close()
+        widget2.close()
+
+    def testRefreshAllWithError(self):
+        widget1 = TimedPlotWidgetF()
+        widget2 = TimedPlotWidgetF()
+        widget1.refresh = MagicMock(side_effect=ValueError)
+        widget2.refresh = MagicMock()
+        for w in (widget1, widget2):
+            w.updateF(1)
+            w.show()
+
+        # an exception raised by one widget does not affect the others
+        TimedPlotWidgetF._refreshAll()
+        widget1.refresh.assert_called_once()
+        widget2.refresh.assert_called_once()
+
+        widget1.close()
+        widget2.close()
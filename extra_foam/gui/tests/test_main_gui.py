@@ -114,7 +114,7 @@ class TestMainGuiCtrl(unittest.TestCase):
         poi_action = self.gui._tool_bar.actions()[4]
         self.assertEqual("Pulse-of-interest", poi_action.text())
         poi_action.trigger()
-        win = list(self.gui._plot_windows.keys())[-1]
+        win = self.gui._plot_windows[-1]
         self.assertIsInstance(win, PulseOfInterestWindow)
         for i, index in enumerate(new_indices):
             self.assertEqual(index, win._poi_imgs[i]._index)
@@ -468,7 +468,7 @@ class TestMainGuiCtrl(unittest.TestCase):
         binning_action = self.gui._tool_bar.actions()[8]
         self.assertEqual("Binning", binning_action.text())
         binning_action.trigger()
-        win = list(self.gui._plot_windows.keys())[-1]
+        win = self.gui._plot_windows[-1]
         win._bin1d_vfom._auto_level = False
         win._bin2d_value._auto_level = False
         win._bin2d_count._auto_level = False
@@ -706,7 +706,7 @@ class TestMainGuiCtrl(unittest.TestCase):
         n_registered = len(self.gui._plot_windows)
         action.trigger()
         if registered:
-            window = list(self.gui._plot_windows.keys())[-1]
+            window = self.gui._plot_windows[-1]
             self.assertEqual(n_registered+1, len(self.gui._plot_windows))
             return window
 
@@ -21,6 +21,8 @@ class Bin1dHist(TimedPlotWidgetF):
 
     Widget for visualizing histogram of count for 1D-binning.
     """
+    _count_brush = FColor.mkBrush('w', alpha=50)
+
     def __init__(self, *, parent=None):
         """Initialization."""
         super().__init__(parent=parent, show_indicator=True)
@@ -32,7 +34,7 @@ class Bin1dHist(TimedPlotWidgetF):
         self._default_y2_label = "Count"
 
         self._count_plot = self.plotBar(
-            y2=True, brush=FColor.mkBrush('w', alpha=50))
+            y2=True, brush=self._count_brush)
         self._fom_plot = self.plotStatisticsBar(line=True)
 
         self._source = ""
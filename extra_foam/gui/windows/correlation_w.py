@@ -7,6 +7,8 @@ Author: Jun Zhu <jun.zhu@xfel.eu>, Ebad Kamil <ebad.kamil@xfel.eu>
 Copyright (C) European X-Ray Free-Electron Laser Facility GmbH.
 All rights reserved.
 """
+import numpy as np
+
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QSplitter
 
@@ -35,15 +37,30 @@ class CorrelationPlot(TimedPlotWidgetF):
         self.setTitle(f'Correlation {idx+1}')
         self._default_x_label = "Correlator (arb. u.)"
         self._default_y_label = "FOM (arb. u.)"
+        self._x_label = ""
+        self.setLabel('left', self._default_y_label)
 
         self._source = ""
         self._resolution = 0.0
 
+        # reusable float64 buffers for data which do not arrive as
+        # float64 arrays, key: name of the data
+        self._buffers = dict()
+
         self.updateLabel()
 
+        # Both the scatter plots and the statistics bar plots are created
+        # only once. Switching resolution only toggles their visibility.
         brush_pair = self._brushes[self._idx]
-        self._plot = self.plotScatter(brush=brush_pair[0])
-        self._plot_slave = self.plotScatter(brush=brush_pair[1])
+        self._scatter_pair = (self.plotScatter(brush=brush_pair[0]),
+                              self.plotScatter(brush=brush_pair[1]))
+        pen_pair = self._pens[self._idx]
+        self._statistics_pair = (self.plotStatisticsBar(pen=pen_pair[0]),
+                                 self.plotStatisticsBar(pen=pen_pair[1]))
+        for item in self._statistics_pair:
+            item.hide()
+
+        self._plot, self._plot_slave = self._scatter_pair
 
     def refresh(self):
         """Override."""
@@ -55,27 +72,56 @@ class CorrelationPlot(TimedPlotWidgetF):
             self.updateLabel()
 
         resolution = item.resolution
-        y = item.y
+        x, y = self._asArray('x', item.x), item.y
         y_slave = item.y_slave
         if resolution == 0:
             # SimplePairSequence
             if self._resolution != 0:
-                self._newScatterPlot()
+                self._switchPlotPair(self._scatter_pair,
+                                     self._statistics_pair)
                 self._resolution = 0
 
-            self._plot.setData(item.x, y)
+            self._plot.setData(x, self._asArray('y', y))
             if y_slave is not None:
-                self._plot_slave.setData(item.x_slave, y_slave)
+                self._plot_slave.setData(
+                    self._asArray('x_slave', item.x_slave),
+                    self._asArray('y_slave', y_slave))
         else:
             # OneWayAccuPairSequence
             if self._resolution == 0:
-                self._newStatisticsBarPlot(resolution)
-                self._resolution = resolution
-            self._plot.setData(item.x, y.avg, y_min=y.min, y_max=y.max)
+                self._switchPlotPair(self._statistics_pair,
+                                     self._scatter_pair)
+            self._resolution = resolution
+            self._plot.setData(x, self._asArray('y', y.avg),
+                               y_min=self._asArray('y_min', y.min),
+                               y_max=self._asArray('y_max', y.max),
+                               beam=resolution)
             if y_slave is not None:
                 self._plot_slave.setData(
-                    item.x_slave, y_slave.avg,
-                    y_min=y_slave.min, y_max=y_slave.max)
+                    self._asArray('x_slave', item.x_slave),
+                    self._asArray('y_slave', y_slave.avg),
+                    y_min=self._asArray('y_slave_min', y_slave.min),
+                    y_max=self._asArray('y_slave_max', y_slave.max),
+                    beam=resolution)
+
+    def _asArray(self, key, data):
+        """Return data as a float64 array.
+
+        Arrays of float64 are returned as they are. Otherwise, data is
+        copied into a buffer which is reused in the following calls.
+        """
+        if data is None or (isinstance(data, np.ndarray)
+                            and data.dtype == np.float64):
+            return data
+
+        n = len(data)
+        buf = self._buffers.get(key)
+        if buf is None or len(buf) < n:
+            buf = np.empty(n if buf is None else max(n, 2 * len(buf)),
+                           dtype=np.float64)
+            self._buffers[key] = buf
+        buf[:n] = data
+        return buf[:n]
 
     def updateLabel(self):
         src = self._source
@@ -83,26 +129,18 @@ class CorrelationPlot(TimedPlotWidgetF):
             new_label = f"{src} (arb. u.)"
         else:
             new_label = self._default_x_label
-        self.setLabel('bottom', new_label)
 
-        self.setLabel('left', self._default_y_label)
-
-    def _newScatterPlot(self):
-        self.removeItem(self._plot)
-        self.removeItem(self._plot_slave)
-
-        brush_pair = self._brushes[self._idx]
-        self._plot = self.plotScatter(brush=brush_pair[0])
-        self._plot_slave = self.plotScatter(brush=brush_pair[1])
-
-    def _newStatisticsBarPlot(self, resolution):
-        self.removeItem(self._plot)
-        self.removeItem(self._plot_slave)
-
-        pen_pair = self._pens[self._idx]
-        self._plot = self.plotStatisticsBar(beam=resolution, pen=pen_pair[0])
-        self._plot_slave = self.plotStatisticsBar(beam=resolution,
-                                                  pen=pen_pair[1])
+        if new_label != self._x_label:
+            self._x_label = new_label
+            self.setLabel('bottom', new_label)
+
+    def _switchPlotPair(self, shown, hidden):
+        for item in hidden:
+            item.setData([], [])
+            item.hide()
+        for item in shown:
+            item.show()
+        self._plot, self._plot_slave = shown
 
 
 class CorrelationWindow(_AbstractPlotWindow):
@@ -7,7 +7,7 @@ Author: Jun Zhu <jun.zhu@xfel.eu>, Ebad Kamil <ebad.kamil@xfel.eu>
 Copyright (C) European X-Ray Free-Electron Laser Facility GmbH.
 All rights reserved.
 """
-from string import Template
+import numpy as np
 
 from PyQt5.QtWidgets import QSplitter
 
@@ -26,6 +26,8 @@ class InTrainFomPlot(PlotWidgetF):
         super().__init__(parent=parent)
 
         self._plot = self.plotScatter()
+        # pulse indices, re-used as long as the number of pulses is the same
+        self._x = np.arange(0)
 
         self.setLabel('left', "FOM")
         self.setLabel('bottom', "Pulse index")
@@ -37,7 +39,10 @@ class InTrainFomPlot(PlotWidgetF):
         if foms is None:
             self.reset()
         else:
-            self._plot.setData(range(len(foms)), foms)
+            n_pulses = len(foms)
+            if len(self._x) != n_pulses:
+                self._x = np.arange(n_pulses)
+            self._plot.setData(self._x, foms)
 
 
 class FomHist(HistMixin, TimedPlotWidgetF):
@@ -50,8 +55,9 @@ class FomHist(HistMixin, TimedPlotWidgetF):
 
         self._plot = self.plotBar()
 
-        self._title_template = Template(
-            f"FOM Histogram (mean: $mean, median: $median, std: $std)")
+        self._title_template = (
+            "FOM Histogram (mean: {mean:.2e}, median: {median:.2e}, "
+            "std: {std:.2e})")
         self.updateTitle()
         self.setLabel('left', 'Counts')
         self.setLabel('bottom', 'FOM')
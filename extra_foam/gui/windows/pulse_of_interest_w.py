@@ -7,8 +7,6 @@ Author: Jun Zhu <jun.zhu@xfel.eu>
 Copyright (C) European X-Ray Free-Electron Laser Facility GmbH.
 All rights reserved.
 """
-from string import Template
-
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QSplitter
 
@@ -60,8 +58,9 @@ class PoiFomHist(HistMixin, TimedPlotWidgetF):
         self._index = idx
         self._plot = self.plotBar(brush=FColor.mkBrush('p'))
 
-        self._title_template = Template(
-            f"FOM Histogram (mean: $mean, median: $median, std: $std)")
+        self._title_template = (
+            "FOM Histogram (mean: {mean:.2e}, median: {median:.2e}, "
+            "std: {std:.2e})")
         self.updateTitle()
         self.setLabel('left', 'Counts')
         self.setLabel('bottom', 'FOM')
@@ -93,8 +92,9 @@ class PoiRoiHist(HistMixin, PlotWidgetF):
         self._index = idx
         self._plot = self.plotBar()
 
-        self._title_template = Template(
-            f"ROI Histogram (mean: $mean, median: $median, std: $std)")
+        self._title_template = (
+            "ROI Histogram (mean: {mean:.2e}, median: {median:.2e}, "
+            "std: {std:.2e})")
         self.updateTitle()
         self.setLabel('left', 'Counts')
         self.setLabel('bottom', 'Pixel value')
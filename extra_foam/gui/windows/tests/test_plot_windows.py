@@ -1,7 +1,9 @@
-import unittest
 from unittest.mock import MagicMock
 from collections import Counter, deque
 
+import pytest
+import numpy as np
+
 from PyQt5.QtWidgets import QMainWindow
 
 from extra_foam.logger import logger
@@ -9,7 +11,17 @@ from extra_foam.gui import mkQApp
 from extra_foam.gui.windows import (
     BinningWindow, CorrelationWindow, HistogramWindow, PumpProbeWindow, RoiWindow
 )
+from extra_foam.gui.windows.binning_w import Bin1dHeatmap, Bin1dHist, Bin2dHeatmap
+from extra_foam.gui.windows.correlation_w import CorrelationPlot
+from extra_foam.gui.windows.histogram_w import FomHist, InTrainFomPlot
+from extra_foam.gui.windows.pulse_of_interest_w import (
+    PulseOfInterestWindow, PoiImageView, PoiFomHist, PoiRoiHist
+)
+from extra_foam.gui.windows.pump_probe_w import (
+    PumpProbeImageView, PumpProbeVFomPlot, PumpProbeFomPlot
+)
 from extra_foam.gui.plot_widgets import RoiImageView
+from extra_foam.gui.plot_widgets.plot_items import StatisticsBarItem, pg
 from extra_foam.pipeline.data_model import ProcessedData
 from extra_foam.pipeline.tests import _TestDataMixin
 
@@ -18,206 +30,155 @@ app = mkQApp()
 logger.setLevel('CRITICAL')
 
 
-class TestPlotWindows(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        cls.gui = QMainWindow()  # dummy MainGUI
-        cls.gui.registerWindow = MagicMock()
-        cls.gui.registerSpecialWindow = MagicMock()
-
-    @classmethod
-    def tearDownClass(cls):
-        cls.gui.close()
-
-    def testPumpProbeWindow(self):
-        from extra_foam.gui.windows.pump_probe_w import (
-            PumpProbeImageView, PumpProbeVFomPlot, PumpProbeFomPlot
-        )
-        win = PumpProbeWindow(deque(), pulse_resolved=True, parent=self.gui)
-
-        self.assertEqual(5, len(win._plot_widgets))
-        counter = Counter()
-        for key in win._plot_widgets:
-            counter[key.__class__] += 1
-
-        self.assertEqual(2, counter[PumpProbeImageView])
-        self.assertEqual(2, counter[PumpProbeVFomPlot])
-        self.assertEqual(1, counter[PumpProbeFomPlot])
-
-        win.updateWidgetsF()
-
-    def testRoiWindow(self):
-        win = RoiWindow(deque(), pulse_resolved=True, parent=self.gui)
-
-        self.assertEqual(2, len(win._plot_widgets))
-        counter = Counter()
-        for key in win._plot_widgets:
-            counter[key.__class__] += 1
-
-        self.assertEqual(2, counter[RoiImageView])
-
-        win.updateWidgetsF()
-
-    def testBinningWindow(self):
-        from extra_foam.gui.windows.binning_w import Bin1dHeatmap, Bin1dHist, Bin2dHeatmap
-
-        win = BinningWindow(deque(maxlen=1), pulse_resolved=True, parent=self.gui)
-
-        self.assertEqual(4, len(win._plot_widgets))
-        counter = Counter()
-        for key in win._plot_widgets:
-            counter[key.__class__] += 1
-
-        self.assertEqual(1, counter[Bin1dHeatmap])
-        self.assertEqual(1, counter[Bin1dHist])
-        self.assertEqual(2, counter[Bin2dHeatmap])
-
-        win.updateWidgetsF()
-
-    def testCorrelationWindow(self):
-        from extra_foam.gui.windows.correlation_w import CorrelationPlot
-
-        win = CorrelationWindow(deque(maxlen=1), pulse_resolved=True, parent=self.gui)
-
-        self.assertEqual(2, len(win._plot_widgets))
-        counter = Counter()
-        for key in win._plot_widgets:
-            counter[key.__class__] += 1
-
-        self.assertEqual(2, counter[CorrelationPlot])
-
-        win.updateWidgetsF()
-
-    def testHistogramWindow(self):
-        from extra_foam.gui.windows.histogram_w import FomHist, InTrainFomPlot
-
-        win = HistogramWindow(deque(maxlen=1), pulse_resolved=True, parent=self.gui)
-
-        self.assertEqual(2, len(win._plot_widgets))
-        counter = Counter()
-        for key in win._plot_widgets:
-            counter[key.__class__] += 1
-
-        self.assertEqual(1, counter[InTrainFomPlot])
-        self.assertEqual(1, counter[FomHist])
-
-        win.updateWidgetsF()
-
-    def testPulseOfInterestWindow(self):
-        from extra_foam.gui.windows.pulse_of_interest_w import (
-            PulseOfInterestWindow, PoiImageView, PoiFomHist, PoiRoiHist
-        )
-
-        win = PulseOfInterestWindow(deque(), pulse_resolved=True, parent=self.gui)
-
-        self.assertEqual(6, len(win._plot_widgets))
-        counter = Counter()
-        for key in win._plot_widgets:
-            counter[key.__class__] += 1
-
-        self.assertEqual(2, counter[PoiImageView])
-        self.assertEqual(2, counter[PoiFomHist])
-        self.assertEqual(2, counter[PoiRoiHist])
+@pytest.fixture(scope="module")
+def gui():
+    """Dummy MainGUI shared by all the tests in this module."""
+    gui = QMainWindow()
+    gui.registerWindow = MagicMock()
+    gui.registerSpecialWindow = MagicMock()
+    yield gui
+    gui.close()
+
+
+@pytest.fixture(scope="module")
+def empty_data():
+    """Empty data shared by all the tests in this module.
+
+    It must not be modified by any test.
+    """
+    return ProcessedData(1)
+
+
+class TestPlotWindows:
+    @pytest.mark.parametrize("win_cls, expected", [
+        (PumpProbeWindow, {PumpProbeImageView: 2,
+                           PumpProbeVFomPlot: 2,
+                           PumpProbeFomPlot: 1}),
+        (RoiWindow, {RoiImageView: 2}),
+        (BinningWindow, {Bin1dHeatmap: 1, Bin1dHist: 1, Bin2dHeatmap: 2}),
+        (CorrelationWindow, {CorrelationPlot: 2}),
+        (HistogramWindow, {InTrainFomPlot: 1, FomHist: 1}),
+        (PulseOfInterestWindow, {PoiImageView: 2,
+                                 PoiFomHist: 2,
+                                 PoiRoiHist: 2}),
+    ])
+    def testWindow(self, gui, win_cls, expected):
+        gui.registerWindow.reset_mock()
+        win = win_cls(deque(maxlen=1), pulse_resolved=True, parent=gui)
+        gui.registerWindow.assert_called_once_with(win)
+
+        counter = Counter(key.__class__ for key in win._plot_widgets)
+        assert expected == counter
 
         win.updateWidgetsF()
 
 
-class testPumpProbeWidgets(unittest.TestCase):
-    def testPumpProbeImageView(self):
-        from extra_foam.gui.windows.pump_probe_w import PumpProbeImageView
-
+class TestPumpProbeWidgets:
+    def testPumpProbeImageView(self, empty_data):
         widget = PumpProbeImageView()
-        data = ProcessedData(1)
-        widget.updateF(data)
-
-    def testPumpProbeVFomPlot(self):
-        from extra_foam.gui.windows.pump_probe_w import PumpProbeVFomPlot
+        widget.updateF(empty_data)
 
+    def testPumpProbeVFomPlot(self, empty_data):
         widget = PumpProbeVFomPlot()
-        data = ProcessedData(1)
-        widget.updateF(data)
-
-    def testPumpProbeFomPlot(self):
-        from extra_foam.gui.windows.pump_probe_w import PumpProbeFomPlot
+        widget.updateF(empty_data)
 
+    def testPumpProbeFomPlot(self, empty_data):
         widget = PumpProbeFomPlot()
-        widget._data = ProcessedData(1)
+        widget._data = empty_data
         widget.refresh()
 
 
-class testPulseOfInterestWidgets(_TestDataMixin, unittest.TestCase):
-    def testPoiImageView(self):
-        from extra_foam.gui.windows.pulse_of_interest_w import PoiImageView
-
+class TestPulseOfInterestWidgets(_TestDataMixin):
+    def testPoiImageView(self, empty_data):
         widget = PoiImageView(0)
-        data = ProcessedData(1)
-        widget.updateF(data)
-
-    def testPoiFomHist(self):
-        from extra_foam.gui.windows.pulse_of_interest_w import PoiFomHist
+        widget.updateF(empty_data)
 
+    def testPoiFomHist(self, empty_data):
         widget = PoiFomHist(0)
 
         # empty data
-        widget._data = ProcessedData(1)
+        widget._data = empty_data
         widget.refresh()
 
         # non-empty data
         widget._data = self.processed_data(1001, (4, 2, 2), histogram=True)
         widget.refresh()
 
-    def testPoiRoiHist(self):
-        from extra_foam.gui.windows.pulse_of_interest_w import PoiRoiHist
-
+    def testPoiRoiHist(self, empty_data):
         widget = PoiRoiHist(0)
 
         # empty data
-        data = ProcessedData(1)
-        widget.updateF(data)
+        widget.updateF(empty_data)
 
         # non-empty data
         data = self.processed_data(1001, (4, 2, 2), histogram=True)
         widget.updateF(data)
 
 
-class testBinningWidgets(unittest.TestCase):
-    def testHeatmap1D(self):
-        from extra_foam.gui.windows.binning_w import Bin1dHeatmap
-
+class TestBinningWidgets:
+    def testHeatmap1D(self, empty_data):
         widget = Bin1dHeatmap()
-        widget._data = ProcessedData(1)
+        widget._data = empty_data
 
         # test "Auto level" reset
         widget._auto_level = True
         widget.refresh()
-        self.assertFalse(widget._auto_level)
-
-    def testHeatmap2D(self):
-        from extra_foam.gui.windows.binning_w import Bin2dHeatmap
+        assert not widget._auto_level
 
+    def testHeatmap2D(self, empty_data):
         for is_count in [False, True]:
             widget = Bin2dHeatmap(count=is_count)
-            widget._data = ProcessedData(1)
+            widget._data = empty_data
 
             # test "Auto level" reset
             widget._auto_level = True
             widget.refresh()
-            self.assertFalse(widget._auto_level)
+            assert not widget._auto_level
 
 
-class testCorrrelationWidgets(_TestDataMixin, unittest.TestCase):
-    def testGeneral(self):
-        from extra_foam.gui.windows.correlation_w import CorrelationPlot
-
+class TestCorrelationWidgets(_TestDataMixin):
+    def testGeneral(self, empty_data):
         for i in range(2):
             widget = CorrelationPlot(0)
-            widget._data = ProcessedData(1)
+            widget._data = empty_data
             widget.refresh()
 
-    def testResolutionSwitch(self):
-        from extra_foam.gui.windows.correlation_w import CorrelationPlot
-        from extra_foam.gui.plot_widgets.plot_items import StatisticsBarItem, pg
+    def testSkipUnchangedData(self):
+        data = self.processed_data(1001, (4, 2, 2), correlation=True)
+
+        widget = CorrelationPlot(0)
+        widget.show()
+        widget._plot.setData = MagicMock()
+        widget._data = data
+        widget._refresh_imp()
+        widget._plot.setData.assert_called_once()
+
+        widget._plot.setData.reset_mock()
+        widget._refresh_imp()
+        widget._plot.setData.assert_not_called()
+
+        widget._data = self.processed_data(1002, (4, 2, 2), correlation=True)
+        widget._refresh_imp()
+        widget._plot.setData.assert_called_once()
+
+        widget.close()
+
+    def testAsArray(self):
+        widget = CorrelationPlot(0)
+        assert widget._asArray('x', None) is None
+
+        x = np.arange(3, dtype=np.float64)
+        assert x is widget._asArray('x', x)
 
+        a = widget._asArray('x', [1, 2, 3])
+        assert np.float64 == a.dtype
+        np.testing.assert_array_equal([1, 2, 3], a)
+        # the buffer is reused
+        b = widget._asArray('x', [4, 5])
+        assert np.shares_memory(a, b)
+        np.testing.assert_array_equal([4, 5], b)
+
+    def testResolutionSwitch(self):
         # resolution1 = 0.0 and resolution2 > 0.0
         data = self.processed_data(1001, (4, 2, 2), correlation=True)
 
@@ -225,42 +186,53 @@ class testCorrrelationWidgets(_TestDataMixin, unittest.TestCase):
         widget._data = data
         widget.refresh()
         plot_item, plot_item_slave = widget._plot, widget._plot_slave
-        self.assertIsInstance(plot_item, pg.ScatterPlotItem)
-        self.assertIsInstance(plot_item_slave, pg.ScatterPlotItem)
+        assert isinstance(plot_item, pg.ScatterPlotItem)
+        assert isinstance(plot_item_slave, pg.ScatterPlotItem)
 
         widget._idx = 1  # a trick
         widget.refresh()
-        self.assertNotIn(plot_item, widget._plot_item.items)  # being deleted
-        self.assertNotIn(plot_item_slave, widget._plot_item.items)  # being deleted
+        # plot items are hidden instead of being deleted
+        assert plot_item in widget._plot_item.items
+        assert plot_item_slave in widget._plot_item.items
+        assert not plot_item.isVisible()
+        assert not plot_item_slave.isVisible()
         plot_item, plot_item_slave = widget._plot, widget._plot_slave
-        self.assertIsInstance(plot_item, StatisticsBarItem)
-        self.assertIsInstance(plot_item_slave, StatisticsBarItem)
+        assert isinstance(plot_item, StatisticsBarItem)
+        assert isinstance(plot_item_slave, StatisticsBarItem)
+        assert plot_item.isVisible()
+        assert plot_item_slave.isVisible()
 
         widget._idx = 0  # a trick
         widget.refresh()
-        self.assertNotIn(plot_item, widget._plot_item.items)  # being deleted
-        self.assertNotIn(plot_item_slave, widget._plot_item.items)  # being deleted
-        self.assertIsInstance(widget._plot, pg.ScatterPlotItem)
-        self.assertIsInstance(widget._plot_slave, pg.ScatterPlotItem)
+        assert not plot_item.isVisible()
+        assert not plot_item_slave.isVisible()
+        assert isinstance(widget._plot, pg.ScatterPlotItem)
+        assert isinstance(widget._plot_slave, pg.ScatterPlotItem)
+        assert widget._plot.isVisible()
+        assert widget._plot_slave.isVisible()
 
 
-class testHistogramWidgets(_TestDataMixin, unittest.TestCase):
-    def testFomHist(self):
-        from extra_foam.gui.windows.histogram_w import FomHist
-
+class TestHistogramWidgets(_TestDataMixin):
+    def testFomHist(self, empty_data):
         widget = FomHist()
 
         # empty data
-        widget._data = ProcessedData(1)
+        widget._data = empty_data
         widget.refresh()
 
         # non-empty data
         widget._data = self.processed_data(1001, (4, 2, 2), histogram=True)
         widget.refresh()
 
-    def testInTrainFomPlot(self):
-        from extra_foam.gui.windows.histogram_w import InTrainFomPlot
-
+    def testInTrainFomPlot(self, empty_data):
         widget = InTrainFomPlot()
-        data = ProcessedData(1)
+        widget.updateF(empty_data)
+
+        data = self.processed_data(1001, (4, 2, 2))
+        data.pulse.hist.pulse_foms = np.arange(4)
+        widget.updateF(data)
+        x = widget._x
+        np.testing.assert_array_equal(np.arange(4), x)
+        # the pulse indices are re-used
         widget.updateF(data)
+        assert x is widget._x
@@ -1,5 +1,6 @@
-import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
+
+import pytest
 
 from PyQt5.QtTest import QSignalSpy
 from PyQt5.QtWidgets import QMainWindow
@@ -15,15 +16,20 @@ app = mkQApp()
 logger.setLevel('CRITICAL')
 
 
-class TestFileStreamWindow(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        cls.gui = QMainWindow()  # dummy MainGUI
-        cls.gui.registerSatelliteWindow = MagicMock()
+@pytest.fixture(scope="module")
+def gui():
+    """Dummy MainGUI shared by all the tests in this module."""
+    gui = QMainWindow()
+    gui.registerSatelliteWindow = MagicMock()
+    yield gui
+    gui.close()
+
 
-    @classmethod
-    def tearDownClass(cls):
-        cls.gui.close()
+class TestFileStreamWindow:
+    @pytest.fixture(autouse=True)
+    def setUp(self, gui):
+        self.gui = gui
+        self.gui.registerSatelliteWindow.reset_mock()
 
     def testWithParent(self):
         from extra_foam.gui.mediator import Mediator
@@ -32,59 +38,66 @@ class TestFileStreamWindow(unittest.TestCase):
         spy = QSignalSpy(mediator.file_stream_initialized_sgn)
         win = FileStreamWindow(parent=self.gui)
         widget = win._ctrl_widget
-        self.assertEqual('*', widget.port_le.text())
-        self.assertTrue(widget.port_le.isReadOnly())
-        self.assertEqual(1, len(spy))
+        assert '*' == widget.port_le.text()
+        assert widget.port_le.isReadOnly()
+        assert 1 == len(spy)
 
         self.gui.registerSatelliteWindow.assert_called_once_with(win)
-        self.gui.registerSatelliteWindow.reset_mock()
 
         mediator.connection_change_sgn.emit({
             "tcp://127.0.0.1:1234": 0,
             "tcp://127.0.0.1:1235": 1,
         })
-        self.assertEqual(1234, win._port)
+        assert 1234 == win._port
 
     def testStandAlone(self):
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             FileStreamWindow(port=454522)
 
         win = FileStreamWindow(port=45452)
         widget = win._ctrl_widget
-        self.assertEqual('45452', widget.port_le.text())
-        self.assertIsNone(win._mediator)
+        assert '45452' == widget.port_le.text()
+        assert win._mediator is None
 
         # test when win._rd_cal is None
         spy = QSignalSpy(win.file_server_started_sgn)
         widget.serve_start_btn.clicked.emit()
-        self.assertEqual(0, len(spy))
+        assert 0 == len(spy)
 
         # test when win._rd_cal is not None
         win._rd_cal = MagicMock()
         widget.serve_start_btn.clicked.emit()
 
-        # test populate sources
-        with patch("extra_foam.gui.windows.file_stream_controller_w.load_runs") as lr:
-            with patch("extra_foam.gui.windows.file_stream_controller_w.gather_sources") as gs:
-                with patch.object(widget, "fillRunInfo") as fri:
-                    with patch.object(widget, "fillSourceTables") as fst:
-                        # test load_runs return (None, None)
-                        win._rd_cal, win._rd_raw = object(), object()
-                        gs.return_value = (set(), set(), set())
-                        lr.return_value = (None, None)
-                        widget.data_folder_le.setText("abc")
-                        lr.assert_called_with("abc")
-                        fri.assert_called_with("")
-                        fst.assert_called_with(None, None)  # test _rd_cal and _rd_raw were reset
-
-                        # test load_runs raises
-                        lr.side_effect = ValueError
-                        fri.assert_called_with("")
-                        fst.assert_called_with(None, None)
-
-                        # test load_runs return
-                        lr.side_effect = None
-                        gs.return_value = ({"DET1", "DET2"},
-                                           {"output1", "output2"},
-                                           {"motor1", "motor2"})
-                        widget.data_folder_le.setText("efg")
+    @patch("extra_foam.gui.windows.file_stream_controller_w.load_runs")
+    def testPopulateSources(self, load_runs):
+        win = FileStreamWindow(port=45452)
+        widget = win._ctrl_widget
+
+        with patch.multiple(widget, fillRunInfo=DEFAULT,
+                            fillSourceTables=DEFAULT) as mocks:
+            fri, fst = mocks['fillRunInfo'], mocks['fillSourceTables']
+
+            # test load_runs return (None, None)
+            win._rd_cal, win._rd_raw = object(), object()
+            load_runs.return_value = (None, None)
+            widget.data_folder_le.setText("abc")
+            load_runs.assert_called_with("abc")
+            fri.assert_called_with("")
+            fst.assert_called_with(None, None)  # test _rd_cal and _rd_raw were reset
+
+            # test load_runs raises
+            win._rd_cal, win._rd_raw = object(), object()
+            load_runs.side_effect = ValueError
+            widget.data_folder_le.setText("efg")
+            load_runs.assert_called_with("efg")
+            fri.assert_called_with("")
+            fst.assert_called_with(None, None)
+
+            # test load_runs return
+            load_runs.side_effect = None
+            rd_cal, rd_raw = MagicMock(train_ids=[1, 2, 3]), MagicMock()
+            load_runs.return_value = (rd_cal, rd_raw)
+            widget.data_folder_le.setText("xyz")
+            fri.assert_called_with("First train ID: 1 / Last train ID: 3 "
+                                   "/ Train ID span: 3")
+            fst.assert_called_with(rd_cal, rd_raw)
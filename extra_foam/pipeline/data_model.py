@@ -628,6 +628,15 @@ class CorrelationData(collections.abc.Mapping):
             self.source = ""
             self.resolution = 0.0
 
+        def update_all(self, x, y, x_slave, y_slave, source, resolution):
+            """Update all the fields at once."""
+            self.x = x
+            self.y = y
+            self.x_slave = x_slave
+            self.y_slave = y_slave
+            self.source = source
+            self.resolution = resolution
+
     __slots__ = ['_common', '_pp']
 
     _N_CORRELATIONS = 2
@@ -722,7 +731,7 @@ class PulseIndexMask:
     LENGTH = config["MAX_N_PULSES_PER_TRAIN"]
 
     def __init__(self):
-        self._indices = np.array([True] * self.LENGTH)
+        self._indices = np.ones(self.LENGTH, dtype=bool)
 
     def mask(self, idx):
         """Mask a given index/list of indices."""
@@ -757,7 +766,7 @@ class PulseIndexMask:
         return np.where(self._indices[:n])[0]
 
     def reset(self):
-        self._indices = np.array([True] * self.LENGTH)
+        self._indices = np.ones(self.LENGTH, dtype=bool)
 
 
 class _XgmDataItem:
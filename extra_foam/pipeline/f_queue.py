@@ -38,9 +38,12 @@ class SimpleQueue:
         return self.get()
 
     def get(self):
-        with self._mutex:
-            if len(self._queue) > 0:
-                return self._queue.popleft()
+        # Popping is atomic for a deque and can only shrink the queue, so
+        # the consumer does not need to wait for the mutex, which is only
+        # needed for the check-then-act in put and put_pop.
+        try:
+            return self._queue.popleft()
+        except IndexError:
             raise Empty
 
     def put_nowait(self, item):
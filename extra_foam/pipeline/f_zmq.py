@@ -62,6 +62,9 @@ class BridgeProxy:
 
         for end in endpoints:
             backend = context.socket(zmq.DEALER)
+            # socket options must be set before connecting
+            backend.setsockopt(zmq.RCVHWM, config['BRIDGE_RCVHWM'])
+            backend.setsockopt(zmq.RCVBUF, config['BRIDGE_RCVBUF'])
             backend.connect(end)
             self._backend[end] = backend
 
@@ -239,6 +239,11 @@ class KaraboBridge(_PipeInBase, _RedisParserMixin):
 
 class MpInQueue(_PipeInBase):
     """A pipe which uses a multi-processing queue to receive data."""
+
+    # timeout of the blocking get from the multi-processing queue, in
+    # second. It bounds the latency of reacting to update and close.
+    _TIMEOUT = 0.01
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -256,7 +261,8 @@ class MpInQueue(_PipeInBase):
 
             if data_in is None:
                 try:
-                    data_in = self._client.get_nowait()
+                    # wait for the data instead of polling the queue
+                    data_in = self._client.get(timeout=self._TIMEOUT)
                 except Empty:
                     pass
 
@@ -282,6 +288,11 @@ class MpInQueue(_PipeInBase):
 
 class MpOutQueue(_PipeOutBase):
     """A pipe which uses a multi-processing queue to dispatch data."""
+
+    # timeout of the blocking put into the multi-processing queue, in
+    # second. It bounds the latency of reacting to update and close.
+    _TIMEOUT = 0.01
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -315,7 +326,8 @@ class MpOutQueue(_PipeOutBase):
 
             if data_out is not None:
                 try:
-                    self._client.put_nowait(data_out)
+                    # wait for the consumer instead of retrying in a loop
+                    self._client.put(data_out, timeout=self._TIMEOUT)
                     data_out = None
                 except Full:
                     pass
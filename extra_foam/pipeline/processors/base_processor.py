@@ -329,19 +329,21 @@ class _BaseProcessorMixin:
         """
         if vrange is not None:
             lb, ub = vrange
+            if math.isinf(lb) and math.isinf(ub):
+                # the default range, no pulse can be out of it
+                return
+
+            arr = np.asarray(arr)
+            # Note: NaN is never out of range.
+            if math.isinf(lb):
+                out_of_range = arr > ub
+            elif math.isinf(ub):
+                out_of_range = arr < lb
+            else:
+                out_of_range = arr > ub
+                out_of_range |= arr < lb
 
-            if not math.isinf(lb) and not math.isinf(ub):
-                for i, v in enumerate(arr):
-                    if v > ub or v < lb:
-                        index_mask.mask(i)
-            elif not math.isinf(lb):
-                for i, v in enumerate(arr):
-                    if v < lb:
-                        index_mask.mask(i)
-            elif not math.isinf(ub):
-                for i, v in enumerate(arr):
-                    if v > ub:
-                        index_mask.mask(i)
+            index_mask.mask(np.flatnonzero(out_of_range))
 
 
 class _BaseProcessor(_BaseProcessorMixin, _RedisParserMixin,
@@ -465,9 +467,41 @@ class SimpleSequence(_AbstractSequence):
         self._x.fill(0)
 
     def extend(self, v_lst):
-        # TODO: improve
-        for v in v_lst:
-            self.append(v)
+        """Add a number of new data points.
+
+        :param iterable v_lst: new data.
+        """
+        x = self._x
+        if not isinstance(v_lst, np.ndarray):
+            v_lst = np.fromiter(v_lst, dtype=x.dtype)
+        n = len(v_lst)
+        if n == 0:
+            return
+
+        max_len = self._max_len
+        if n >= max_len:
+            x[:max_len] = v_lst[n - max_len:]
+            self._i0 = 0
+            self._len = max_len
+            return
+
+        end = self._i0 + self._len
+        if end + n > self._OVER_CAPACITY * max_len:
+            # move the data to be kept to the beginning
+            keep = min(self._len, max_len - n)
+            x[:keep] = x[end - keep:end]
+            self._i0 = 0
+            self._len = keep
+            end = keep
+
+        x[end:end + n] = v_lst
+        self._len = min(self._len + n, max_len)
+        self._i0 = end + n - self._len
+
+        if self._i0 >= max_len:
+            # the same layout as appending the data points one by one
+            x[:self._len] = x[self._i0:self._i0 + self._len]
+            self._i0 = 0
 
 
 class SimpleVectorSequence(_AbstractSequence):
@@ -585,9 +619,8 @@ class OneWayAccuPairSequence(_AbstractSequence):
         self._min_count = min_count
         self._epsilon = np.abs(epsilon)
 
-        if resolution <= 0:
-            raise ValueError("'resolution must be positive!")
-        self._resolution = resolution
+        self._resolution = None
+        self.set_resolution(resolution)
 
         self._x_avg = np.zeros(self._OVER_CAPACITY * max_len, dtype=dtype)
         self._count = np.zeros(
@@ -687,6 +720,18 @@ class OneWayAccuPairSequence(_AbstractSequence):
                     self._y_max[:max_len] = self._y_max[max_len:]
                     self._y_std[:max_len] = self._y_std[max_len:]
 
+    def set_resolution(self, resolution):
+        """Set the resolution.
+
+        The allocated storage is kept. Call reset() to discard the data
+        accumulated with the previous resolution.
+
+        :param float resolution: new resolution.
+        """
+        if resolution <= 0:
+            raise ValueError("'resolution must be positive!")
+        self._resolution = resolution
+
     def reset(self):
         """Overload."""
         self._i0 = 0
@@ -30,6 +30,10 @@ class CorrelationProcessor(_BaseProcessor):
         _correlation_slave (Sequence): pair sequences (SimplePairSequence,
             OneWayAccuPairSequence) for storing the history of
             (correlator, FOM slave).
+        _simple_pairs (tuple): (SimplePairSequence, SimplePairSequence)
+            used when resolution is 0.
+        _accu_pairs (tuple): (OneWayAccuPairSequence, OneWayAccuPairSequence)
+            used when resolution is positive.
         _source: source of slow data.
         _resolution: resolution of correlation.
         _reset: reset flag for correlation data.
@@ -37,6 +41,7 @@ class CorrelationProcessor(_BaseProcessor):
             (correlator, FOM) which is displayed in PumpProbeWindow.
         _pp_fail_flag (int): a flag used to check whether pump-probe FOM is
             available
+        _fom_getters (dict): FOM getters keyed by analysis type.
     """
 
     # 10 pulses/train * 60 seconds * 5 minutes = 3000
@@ -46,12 +51,20 @@ class CorrelationProcessor(_BaseProcessor):
         super().__init__()
 
         self._idx = index
+        self._source_key = f'source{index}'
+        self._resolution_key = f'resolution{index}'
+        self._reset_key = f'reset{index}'
 
         self.analysis_type = AnalysisType.UNDEFINED
         self._pp_analysis_type = AnalysisType.UNDEFINED
 
-        self._correlation = SimplePairSequence(max_len=self._MAX_POINTS)
-        self._correlation_slave = SimplePairSequence(max_len=self._MAX_POINTS)
+        self._simple_pairs = (
+            SimplePairSequence(max_len=self._MAX_POINTS),
+            SimplePairSequence(max_len=self._MAX_POINTS),
+        )
+        # created on demand since a positive resolution is required
+        self._accu_pairs = None
+        self._correlation, self._correlation_slave = self._simple_pairs
         self._source = ""
         self._resolution = 0.0
         self._reset = False
@@ -59,39 +72,49 @@ class CorrelationProcessor(_BaseProcessor):
         self._correlation_pp = SimplePairSequence(max_len=self._MAX_POINTS)
         self._pp_fail_flag = 0
 
+        self._fom_getters = {
+            AnalysisType.PUMP_PROBE: self._get_pp_fom,
+            AnalysisType.ROI_FOM: self._get_roi_fom,
+            AnalysisType.ROI_PROJ: self._get_roi_proj_fom,
+            AnalysisType.AZIMUTHAL_INTEG: self._get_ai_fom,
+        }
+
     def update(self):
         """Override."""
-        idx = self._idx
-        cfg = self._meta.hget_all(mt.CORRELATION_PROC)
+        cfg = self._meta.hget_all_and_hdel(
+            mt.CORRELATION_PROC, self._reset_key)
 
         if self._update_analysis(AnalysisType(int(cfg['analysis_type']))):
             self._reset = True
 
-        src = cfg[f'source{idx}']
+        src = cfg[self._source_key]
         if self._source != src:
             self._source = src
             self._reset = True
 
-        resolution = float(cfg[f'resolution{idx}'])
-        if self._resolution != 0 and resolution == 0:
-            self._correlation = SimplePairSequence(
-                max_len=self._MAX_POINTS)
-            self._correlation_slave = SimplePairSequence(
-                max_len=self._MAX_POINTS)
-        elif self._resolution == 0 and resolution != 0:
-            self._correlation = OneWayAccuPairSequence(
-                resolution, max_len=self._MAX_POINTS)
-            self._correlation_slave = OneWayAccuPairSequence(
-                resolution, max_len=self._MAX_POINTS)
-        elif self._resolution != resolution:
-            # In the above two cases, we do not need 'reset' since
-            # new Sequence object will be constructed.
+        resolution = float(cfg[self._resolution_key])
+        if self._resolution != resolution:
+            if resolution == 0:
+                self._correlation, self._correlation_slave = \
+                    self._simple_pairs
+            else:
+                if self._accu_pairs is None:
+                    self._accu_pairs = (
+                        OneWayAccuPairSequence(
+                            resolution, max_len=self._MAX_POINTS),
+                        OneWayAccuPairSequence(
+                            resolution, max_len=self._MAX_POINTS),
+                    )
+                else:
+                    for seq in self._accu_pairs:
+                        seq.set_resolution(resolution)
+                self._correlation, self._correlation_slave = \
+                    self._accu_pairs
+            # the re-used sequences still hold the previous data
             self._reset = True
-        self._resolution = resolution
+            self._resolution = resolution
 
-        reset_key = f'reset{idx}'
-        if reset_key in cfg:
-            self._meta.hdel(mt.CORRELATION_PROC, reset_key)
+        if self._reset_key in cfg:
             self._reset = True
 
     @profiler("Correlation Processor")
@@ -125,11 +148,10 @@ class CorrelationProcessor(_BaseProcessor):
         except ProcessingError as e:
             logger.error(f"[Correlation] {str(e)}!")
 
-        out = processed.corr[self._idx - 1]
-        out.x, out.y = self._correlation.data()
-        out.x_slave, out.y_slave = self._correlation_slave.data()
-        out.source = self._source
-        out.resolution = self._resolution
+        x, y = self._correlation.data()
+        x_slave, y_slave = self._correlation_slave.data()
+        processed.corr[self._idx - 1].update_all(
+            x, y, x_slave, y_slave, self._source, self._resolution)
 
     def _process_pump_probe(self, data):
         """Process the correlation in pump-probe analysis.
@@ -151,39 +173,52 @@ class CorrelationProcessor(_BaseProcessor):
         c = processed.corr.pp
         c.x, c.y = self._correlation_pp.data()
 
-    def _update_data_point(self, processed, raw):
-        analysis_type = self.analysis_type
-        fom_slave = None
-        if analysis_type == AnalysisType.PUMP_PROBE:
-            fom = processed.pp.fom
-            if fom is None:
-                self._pp_fail_flag += 1
-                # if on/off pulses are in different trains, pump-probe FOM is
-                # only calculated every other train.
-                if self._pp_fail_flag == 2:
-                    self._pp_fail_flag = 0
-                    raise ProcessingError("Pump-probe FOM is not available")
-                return
-            else:
+    def _get_pp_fom(self, processed):
+        fom = processed.pp.fom
+        if fom is None:
+            self._pp_fail_flag += 1
+            # if on/off pulses are in different trains, pump-probe FOM is
+            # only calculated every other train.
+            if self._pp_fail_flag == 2:
                 self._pp_fail_flag = 0
-        elif analysis_type == AnalysisType.ROI_FOM:
-            fom = processed.roi.fom
-            fom_slave = processed.roi.fom_slave
-            if fom is None:
-                raise ProcessingError("ROI FOM is not available")
-        elif analysis_type == AnalysisType.ROI_PROJ:
-            fom = processed.roi.proj.fom
-            if fom is None:
-                raise ProcessingError("ROI projection FOM is not available")
-        elif analysis_type == AnalysisType.AZIMUTHAL_INTEG:
-            fom = processed.ai.fom
-            if fom is None:
-                raise ProcessingError(
-                    "Azimuthal integration FOM is not available")
+                raise ProcessingError("Pump-probe FOM is not available")
         else:
+            self._pp_fail_flag = 0
+        return fom, None
+
+    @staticmethod
+    def _get_roi_fom(processed):
+        roi = processed.roi
+        if roi.fom is None:
+            raise ProcessingError("ROI FOM is not available")
+        return roi.fom, roi.fom_slave
+
+    @staticmethod
+    def _get_roi_proj_fom(processed):
+        fom = processed.roi.proj.fom
+        if fom is None:
+            raise ProcessingError("ROI projection FOM is not available")
+        return fom, None
+
+    @staticmethod
+    def _get_ai_fom(processed):
+        fom = processed.ai.fom
+        if fom is None:
+            raise ProcessingError(
+                "Azimuthal integration FOM is not available")
+        return fom, None
+
+    def _update_data_point(self, processed, raw):
+        try:
+            get_fom = self._fom_getters[self.analysis_type]
+        except KeyError:
             raise UnknownParameterError(
                 f"[Correlation] Unknown analysis type: {self.analysis_type}")
 
+        fom, fom_slave = get_fom(processed)
+        if fom is None:
+            return
+
         v, err = self._fetch_property_data(processed.tid, raw, self._source)
 
         if err:
@@ -15,7 +15,7 @@ import numpy as np
 from .base_processor import _BaseProcessor
 from ..data_model import MovingAverageArray, RectRoiGeom
 from ..exceptions import ProcessingError, UnknownParameterError
-from ...algorithms import nanhist_with_stats, nanmean, nansum, slice_curve
+from ...algorithms import nanhist_with_stats, nanmean, nansum
 from ...ipc import process_logger as logger
 from ...database import Metadata as mt
 from ...utils import profiler
@@ -174,6 +174,17 @@ class ImageRoiPulse(_RoiProcessorBase):
                         threshold_mask=threshold_mask)
         return handler(roi, axis=(-2, -1))
 
+    def _compute_roi_fom(self, geom, assembled, fom_type, image_data):
+        """Crop the ROI and its image mask and calculate the FOM."""
+        roi = geom.rect(assembled)
+        if roi is None:
+            return
+
+        image_mask = image_data.image_mask
+        mask = None if image_mask is None else geom.rect(image_mask)
+        return self._compute_fom(
+            roi, fom_type, mask, image_data.threshold_mask)
+
     def _process_norm(self, assembled, processed):
         """Calculate pulse-resolved ROI normalizers.
 
@@ -182,32 +193,28 @@ class ImageRoiPulse(_RoiProcessorBase):
         if not self._meta.has_analysis(AnalysisType.ROI_NORM_PULSE):
             return
 
-        threshold_mask = processed.image.threshold_mask
-        image_mask = processed.image.image_mask
-
+        image_data = processed.image
         roi = processed.roi
 
-        roi3 = roi.geom3.rect(assembled)
-        mask3 = None if image_mask is None else roi.geom3.rect(image_mask)
-        roi4 = roi.geom4.rect(assembled)
-        mask4 = None if image_mask is None else roi.geom4.rect(image_mask)
-
+        # only crop the ROIs which are required by the combination
         if self._norm_combo == RoiCombo.ROI3:
-            processed.pulse.roi.norm = self._compute_fom(
-                roi3, self._norm_type, mask3, threshold_mask)
+            processed.pulse.roi.norm = self._compute_roi_fom(
+                roi.geom3, assembled, self._norm_type, image_data)
         elif self._norm_combo == RoiCombo.ROI4:
-            processed.pulse.roi.norm = self._compute_fom(
-                roi4, self._norm_type, mask4, threshold_mask)
+            processed.pulse.roi.norm = self._compute_roi_fom(
+                roi.geom4, assembled, self._norm_type, image_data)
         else:
-            norm3 = self._compute_fom(
-                roi3, self._norm_type, mask3, threshold_mask)
-            norm4 = self._compute_fom(
-                roi4, self._norm_type, mask4, threshold_mask)
+            norm3 = self._compute_roi_fom(
+                roi.geom3, assembled, self._norm_type, image_data)
+            norm4 = self._compute_roi_fom(
+                roi.geom4, assembled, self._norm_type, image_data)
             if norm3 is not None and norm4 is not None:
+                # norm3 is a temporary array and can be overwritten
                 if self._norm_combo == RoiCombo.ROI3_SUB_ROI4:
-                    processed.pulse.roi.norm = norm3 - norm4
+                    processed.pulse.roi.norm = np.subtract(
+                        norm3, norm4, out=norm3)
                 elif self._norm_combo == RoiCombo.ROI3_ADD_ROI4:
-                    processed.pulse.roi.norm = norm3 + norm4
+                    processed.pulse.roi.norm = np.add(norm3, norm4, out=norm3)
                 else:
                     raise UnknownParameterError(
                         f"[ROI][normalizer] Unknown ROI combo: "
@@ -226,35 +233,30 @@ class ImageRoiPulse(_RoiProcessorBase):
         if not self._meta.has_analysis(AnalysisType.ROI_FOM_PULSE):
             return
 
-        threshold_mask = processed.image.threshold_mask
-        image_mask = processed.image.image_mask
-
+        image_data = processed.image
         roi = processed.roi
 
-        roi1 = roi.geom1.rect(assembled)
-        mask1 = None if image_mask is None else roi.geom1.rect(image_mask)
-        roi2 = roi.geom2.rect(assembled)
-        mask2 = None if image_mask is None else roi.geom2.rect(image_mask)
-
+        # only crop the ROIs which are required by the combination
         if self._fom_combo == RoiCombo.ROI1:
-            processed.pulse.roi.fom = self._compute_fom(
-                roi1, self._fom_type, mask1, threshold_mask)
+            processed.pulse.roi.fom = self._compute_roi_fom(
+                roi.geom1, assembled, self._fom_type, image_data)
         elif self._fom_combo == RoiCombo.ROI2:
-            processed.pulse.roi.fom = self._compute_fom(
-                roi2, self._fom_type, mask2, threshold_mask)
+            processed.pulse.roi.fom = self._compute_roi_fom(
+                roi.geom2, assembled, self._fom_type, image_data)
         else:
-            fom1 = self._compute_fom(
-                roi1, self._fom_type, mask1, threshold_mask)
-            fom2 = self._compute_fom(
-                roi2, self._fom_type, mask2, threshold_mask)
+            fom1 = self._compute_roi_fom(
+                roi.geom1, assembled, self._fom_type, image_data)
+            fom2 = self._compute_roi_fom(
+                roi.geom2, assembled, self._fom_type, image_data)
             if fom1 is not None and fom2 is not None:
+                # fom1 is a temporary array and can be overwritten
                 if self._fom_combo == RoiCombo.ROI1_SUB_ROI2:
-                    processed.pulse.roi.fom = fom1 - fom2
+                    processed.pulse.roi.fom = np.subtract(fom1, fom2, out=fom1)
                 elif self._fom_combo == RoiCombo.ROI1_ADD_ROI2:
-                    processed.pulse.roi.fom = fom1 + fom2
+                    processed.pulse.roi.fom = np.add(fom1, fom2, out=fom1)
                 elif self._fom_combo == RoiCombo.ROI1_DIV_ROI2:
                     # nan and inf will propagate downstream
-                    processed.pulse.roi.fom = fom1 / fom2
+                    processed.pulse.roi.fom = np.divide(fom1, fom2, out=fom1)
                 else:
                     raise UnknownParameterError(
                         f"[ROI][FOM] Unknown ROI combo: {self._fom_combo}")
@@ -309,11 +311,12 @@ class ImageRoiTrain(_RoiProcessorBase):
         _proj_fom_integ_range (tuple): integration range for calculating
             FOM from the normalized projection.
         _ma_window (int): moving average window size.
+        _proj_x (numpy.ndarray): x coordinates of the ROI projection.
     """
 
     _proj_handlers = {
-        RoiProjType.SUM: np.nansum,
-        RoiProjType.MEAN: np.nanmean,
+        RoiProjType.SUM: nansum,
+        RoiProjType.MEAN: nanmean,
     }
 
     _roi1 = MovingAverageArray()
@@ -342,6 +345,7 @@ class ImageRoiTrain(_RoiProcessorBase):
         self._proj_norm = Normalizer.UNDEFINED
         self._proj_auc_range = (0, math.inf)
         self._proj_fom_integ_range = (0, math.inf)
+        self._proj_x = np.arange(0)
 
         self._set_ma_window(1)
 
@@ -452,11 +456,12 @@ class ImageRoiTrain(_RoiProcessorBase):
 
         try:
             handler = self._fom_handlers[fom_type]
-            return handler(roi)
         except KeyError:
             raise UnknownParameterError(
                 f"[ROI][FOM] Unknown FOM type: {fom_type}")
 
+        return handler(roi)
+
     def _process_hist(self, processed):
         """Calculate ROI histogram."""
         if self._hist_combo == RoiCombo.UNDEFINED:
@@ -622,6 +627,15 @@ class ImageRoiTrain(_RoiProcessorBase):
                 f"[ROI][projection] Unknown projection direction: "
                 f"{self._proj_direct}")
 
+    def _get_proj_x(self, n):
+        """Return the x coordinates of a projection with n points.
+
+        The array is re-used as long as the ROI size does not change.
+        """
+        if len(self._proj_x) != n:
+            self._proj_x = np.arange(n)
+        return self._proj_x
+
     def _process_proj(self, processed):
         """Calculate train-resolved ROI projection."""
         try:
@@ -635,7 +649,7 @@ class ImageRoiTrain(_RoiProcessorBase):
             return
         proj = self._compute_proj(roi_combo)
 
-        x = np.arange(len(proj))
+        x = self._get_proj_x(len(proj))
 
         try:
             normalized_proj = self._normalize_fom(
@@ -668,7 +682,7 @@ class ImageRoiTrain(_RoiProcessorBase):
         y_on = self._compute_proj(roi_combo_on)
         y_off = self._compute_proj(roi_combo_off)
 
-        x = np.arange(len(y_on))
+        x = self._get_proj_x(len(y_on))
 
         try:
             normalized_y_on, normalized_y_off = self._normalize_fom_pp(
@@ -677,7 +691,11 @@ class ImageRoiTrain(_RoiProcessorBase):
 
             normalized_y = normalized_y_on - normalized_y_off
 
-            sliced = slice_curve(normalized_y, x, *self._proj_fom_integ_range)[0]
+            # x is monotonically increasing, so the integration range can
+            # be taken as a view instead of going through slice_curve
+            lb, ub = self._proj_fom_integ_range
+            sliced = normalized_y[np.searchsorted(x, lb):
+                                  np.searchsorted(x, ub, side='right')]
             if pp.abs_difference:
                 fom = np.sum(np.abs(sliced))
             else:
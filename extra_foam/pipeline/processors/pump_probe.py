@@ -117,7 +117,7 @@ class PumpProbeProcessor(_BaseProcessor):
         else:
             if assembled.ndim == 3:
                 if dropped_indices:
-                    indices = list(set(range(n_images)) - set(dropped_indices))
+                    indices = processed.pidx.kept_indices(n_images).tolist()
                     if not indices:
                         raise DropAllPulsesError(
                             f"[Pump-probe] {tid}: all pulses were dropped")
@@ -4,6 +4,7 @@ import numpy as np
 
 from extra_foam.config import AnalysisType
 from extra_foam.database import MetaProxy
+from extra_foam.pipeline.data_model import PulseIndexMask
 from extra_foam.logger import logger
 from extra_foam.pipeline.processors.base_processor import (
     _BaseProcessor, UnknownParameterError, SimpleSequence, SimpleVectorSequence,
@@ -104,6 +105,28 @@ class TestBaseProcessor(unittest.TestCase):
         self._proc1._update_analysis(AnalysisType.UNDEFINED)
         self._check_has_no_analysis(AnalysisType.ROI_PROJ)
 
+    def testFilterPulseByVrange(self):
+        proc = _DummyProcessor()
+        foms = np.array([-1., 0., np.nan, 1., 2., 3.])
+
+        index_mask = PulseIndexMask()
+        proc.filter_pulse_by_vrange(foms, None, index_mask, "abc")
+        self.assertEqual(0, index_mask.n_dropped(6))
+
+        proc.filter_pulse_by_vrange(foms, (-np.inf, np.inf), index_mask, "abc")
+        self.assertEqual(0, index_mask.n_dropped(6))
+
+        proc.filter_pulse_by_vrange(foms, (0, 2), index_mask, "abc")
+        np.testing.assert_array_equal([0, 5], index_mask.dropped_indices(6))
+
+        index_mask.reset()
+        proc.filter_pulse_by_vrange(list(foms), (0, np.inf), index_mask, "abc")
+        np.testing.assert_array_equal([0], index_mask.dropped_indices(6))
+
+        index_mask.reset()
+        proc.filter_pulse_by_vrange(foms, (-np.inf, 1), index_mask, "abc")
+        np.testing.assert_array_equal([4, 5], index_mask.dropped_indices(6))
+
     def _check_has_analysis(self, analysis_type):
         self.assertTrue(self._meta.has_analysis(analysis_type))
         self.assertTrue(self._meta.has_analysis(analysis_type))
@@ -152,6 +175,30 @@ class TestSequenceData(unittest.TestCase):
         self.assertEqual(overflow, ax[0])
         self.assertEqual(MAX_LENGTH + overflow - 1, ax[-1])
 
+    def testSimpleSequenceExtend(self):
+        MAX_LENGTH = 100
+
+        hist = SimpleSequence(max_len=MAX_LENGTH)
+        hist_gt = SimpleSequence(max_len=MAX_LENGTH)
+        # test different paths including wrapping around the buffer
+        start = 0
+        for n in [0, 3, 50, 99, 1, 100, 250, 7, 60, 60, 60]:
+            values = np.arange(start, start + n)
+            start += n
+            hist.extend(values)
+            for v in values:
+                hist_gt.append(v)
+            np.testing.assert_array_equal(hist_gt.data(), hist.data())
+            # append after extend
+            hist.append(-start)
+            hist_gt.append(-start)
+            np.testing.assert_array_equal(hist_gt.data(), hist.data())
+
+        # test iterator
+        hist.reset()
+        hist.extend(iter([1, 2, 3]))
+        np.testing.assert_array_equal([1, 2, 3], hist.data())
+
     def testSimpleVectorSequence(self):
         MAX_LENGTH = 1000
 
@@ -252,6 +299,13 @@ class TestSequenceData(unittest.TestCase):
         with self.assertRaises(ValueError):
             OneWayAccuPairSequence(-1)
 
+        # set_resolution
+        hist = OneWayAccuPairSequence(0.1)
+        with self.assertRaises(ValueError):
+            hist.set_resolution(0)
+        hist.set_resolution(0.2)
+        self.assertEqual(0.2, hist._resolution)
+
         hist = OneWayAccuPairSequence(0.1, max_len=MAX_LENGTH, min_count=2)
         self.assertEqual(0, len(hist))
 
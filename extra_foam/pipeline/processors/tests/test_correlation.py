@@ -17,6 +17,7 @@ from extra_foam.pipeline.processors.correlation import (
 )
 
 from extra_foam.config import AnalysisType
+from extra_foam.pipeline.exceptions import UnknownParameterError
 
 from extra_foam.pipeline.tests import _TestDataMixin
 
@@ -128,6 +129,108 @@ class TestCorrelationProcessor(_TestDataMixin):
             error.reset_mock()
             assert 0 == proc._pp_fail_flag
 
+    @mock.patch('extra_foam.ipc.ProcessLogger.error')
+    @pytest.mark.parametrize("analysis_type", _analysis_types)
+    def testSkipPropertyFetchWithoutFom(self, error, analysis_type):
+        data, processed = self.simple_data(1001, (2, 2))
+        data['raw'] = {'A ppt': 1}
+
+        proc = CorrelationProcessor(1)
+        proc.analysis_type = analysis_type
+        proc._source = 'A ppt'
+
+        with mock.patch.object(proc, "_fetch_property_data") as fetch:
+            self._set_fom(processed, analysis_type, None)
+            proc.process(data)
+            fetch.assert_not_called()
+
+            self._set_fom(processed, analysis_type, 10.)
+            fetch.return_value = (1, "")
+            proc.process(data)
+            fetch.assert_called_once_with(1001, data['raw'], 'A ppt')
+
+    def testUpdate(self):
+        proc = CorrelationProcessor(1)
+        proc._update_analysis = mock.MagicMock(return_value=False)
+        proc._meta.hget_all_and_hdel = mock.MagicMock(return_value={
+            'analysis_type': '1',
+            'source1': 'A ppt',
+            'resolution1': '0.0',
+        })
+        get_cfg = proc._meta.hget_all_and_hdel
+        simple_pairs = proc._simple_pairs
+
+        proc.update()
+        assert proc._reset
+        assert proc._accu_pairs is None
+        assert (proc._correlation, proc._correlation_slave) == simple_pairs
+
+        # switch to accumulative sequences
+        proc._reset = False
+        get_cfg.return_value['resolution1'] = '1.0'
+        proc.update()
+        assert proc._reset
+        accu_pairs = proc._accu_pairs
+        assert isinstance(accu_pairs[0], OneWayAccuPairSequence)
+        assert (proc._correlation, proc._correlation_slave) == accu_pairs
+
+        # switch back to simple sequences
+        proc._reset = False
+        get_cfg.return_value['resolution1'] = '0.0'
+        proc.update()
+        assert proc._reset
+        assert (proc._correlation, proc._correlation_slave) == simple_pairs
+
+        # the accumulative sequences are re-used with the new resolution
+        proc._reset = False
+        get_cfg.return_value['resolution1'] = '2.0'
+        proc.update()
+        assert proc._reset
+        assert proc._accu_pairs is accu_pairs
+        assert (proc._correlation, proc._correlation_slave) == accu_pairs
+        assert all(seq._resolution == 2.0 for seq in accu_pairs)
+
+        # nothing changes
+        proc._reset = False
+        proc.update()
+        assert not proc._reset
+        get_cfg.assert_called_with('meta:proc:correlation', 'reset1')
+
+        # reset
+        get_cfg.return_value['reset1'] = '1'
+        proc.update()
+        assert proc._reset
+
+    def testPumpProbeNotActivated(self):
+        data, processed = self.simple_data(1001, (2, 2))
+        pp = processed.pp
+        corr_pp = processed.corr.pp
+
+        proc = CorrelationProcessor(1)
+        proc._correlation_pp.append((1000, 1))
+
+        # pump-probe analysis was deactivated in this train
+        pp.reset = True
+        proc._process_pump_probe(data)
+        assert 0 == len(proc._correlation_pp)
+        np.testing.assert_array_equal([], corr_pp.x)
+
+        # pump-probe analysis is not activated, the plot still receives
+        # the (empty) history
+        pp.reset = False
+        corr_pp.x = corr_pp.y = None
+        proc._process_pump_probe(data)
+        np.testing.assert_array_equal([], corr_pp.x)
+        np.testing.assert_array_equal([], corr_pp.y)
+
+    def testUnknownAnalysisType(self):
+        data, processed = self.simple_data(1001, (2, 2))
+
+        proc = CorrelationProcessor(1)
+        proc.analysis_type = AnalysisType.ROI_NORM
+        with pytest.raises(UnknownParameterError):
+            proc._update_data_point(processed, data['raw'])
+
     @pytest.mark.parametrize("index", [0, 1])
     def testMaskSlave(self, index):
         data, processed = self.simple_data(1001, (2, 2))
@@ -82,6 +82,22 @@ class TestImageRoiPulse(_TestDataMixin):
         assert list(roi.geom3.geometry) == proc._geom3
         assert list(roi.geom4.geometry) == proc._geom4
 
+    def testComputeRequiredRoisOnly(self):
+        proc = self._proc
+        proc._fom_combo = RoiCombo.ROI1
+        proc._norm_combo = RoiCombo.ROI4
+
+        data, processed = self._get_data()
+        with patch.object(proc._meta, 'has_analysis', side_effect=lambda x: True):
+            with patch.object(proc, '_compute_fom') as compute_fom:
+                proc.process(data)
+                assert 2 == compute_fom.call_count
+                s1 = self._get_roi_slice(proc._geom1)
+                s4 = self._get_roi_slice(proc._geom4)
+                shapes = {c[0][0].shape for c in compute_fom.call_args_list}
+                assert {(4, s1[0].stop - s1[0].start, s1[1].stop - s1[1].start),
+                        (4, s4[0].stop - s4[0].start, s4[1].stop - s4[1].start)} == shapes
+
     @pytest.mark.parametrize("norm_type, fom_handler",
                              [(k, v) for k, v in _roi_fom_handlers.items()])
     def testRoiNorm(self, norm_type, fom_handler):
@@ -451,6 +467,15 @@ class TestImageRoiTrain(_TestDataMixin):
                 proc.process(data)
                 error.assert_called_once()
 
+    def testProjX(self):
+        proc = self._proc
+
+        x = proc._get_proj_x(4)
+        np.testing.assert_array_equal(np.arange(4), x)
+        # re-used if the size does not change
+        assert x is proc._get_proj_x(4)
+        np.testing.assert_array_equal(np.arange(3), proc._get_proj_x(3))
+
     @pytest.mark.parametrize("proj_type, proj_handler",
                              [(k, v) for k, v in _roi_proj_handlers.items()])
     @pytest.mark.parametrize("direct, axis", [('x', -2), ('y', -1)])
@@ -657,6 +682,11 @@ class TestImageRoiTrain(_TestDataMixin):
             processed.pp.abs_difference = False
             proc.process(data)
             assert (y_on_gt - y_off_gt).sum() == processed.pp.fom
+            # test FOM integration range
+            proc._proj_fom_integ_range = (0.5, 2)
+            proc.process(data)
+            assert (y_on_gt - y_off_gt)[1:3].sum() == processed.pp.fom
+            proc._proj_fom_integ_range = (0, np.inf)
 
         for proj_combo in [RoiCombo.ROI1_SUB_ROI2, RoiCombo.ROI1_ADD_ROI2]:
             data, processed = self._get_data()
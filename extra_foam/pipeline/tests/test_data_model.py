@@ -414,6 +414,17 @@ class TestCorrelationData(unittest.TestCase):
         with self.assertRaises(AttributeError):
             data.c = data.CorrelationDataItem()
 
+        # test update_all
+        item = data[0]
+        x, y, x_slave, y_slave = [np.arange(i, i + 3) for i in range(4)]
+        item.update_all(x, y, x_slave, y_slave, "A ppt", 0.5)
+        self.assertIs(x, item.x)
+        self.assertIs(y, item.y)
+        self.assertIs(x_slave, item.x_slave)
+        self.assertIs(y_slave, item.y_slave)
+        self.assertEqual("A ppt", item.source)
+        self.assertEqual(0.5, item.resolution)
+
 
 class TestHistogramData(unittest.TestCase):
 
@@ -5,6 +5,7 @@ import zmq
 import msgpack
 
 from extra_foam.pipeline.f_zmq import BridgeProxy
+from extra_foam.config import config
 
 
 def _simple_data_in_karabo(src):
@@ -77,3 +78,14 @@ class TestZmq(unittest.TestCase):
             self.assertIsNone(proxy._client)
 
         ctx.destroy(linger=0)
+
+    def testBackendSocketOptions(self):
+        proxy = BridgeProxy()
+        proxy.connect("tcp://127.0.0.1:45454")
+        for bk in proxy._backend.values():
+            self.assertEqual(config['BRIDGE_RCVHWM'],
+                             bk.getsockopt(zmq.RCVHWM))
+            if config['BRIDGE_RCVBUF'] > 0:
+                self.assertEqual(config['BRIDGE_RCVBUF'],
+                                 bk.getsockopt(zmq.RCVBUF))
+        proxy._context.destroy(linger=0)
@@ -21,6 +21,24 @@ from ..config import _MAX_INT32
 _PIXEL_DTYPE = np.float32
 
 
+def _validate_dark_array(arr, ndim=3):
+    """Validate the data array of a dark run.
+
+    :param xarray.DataArray/numpy.ndarray arr: dark data.
+    :param int ndim: expected number of dimensions.
+
+    :raise ProcessingError: if the array does not have the expected number
+        of dimensions or its data type is not numeric.
+    """
+    if arr.ndim != ndim:
+        raise ProcessingError(f"Data must be a {ndim}D array! "
+                              f"Actual shape: {arr.shape}")
+
+    if arr.dtype.kind not in "uif":
+        raise ProcessingError(f"Data must be numeric! "
+                              f"Actual dtype: {arr.dtype}")
+
+
 class GotthardProcessor(QThreadWorker):
     """Gotthard analysis processor.
 
@@ -64,6 +82,11 @@ class GotthardProcessor(QThreadWorker):
         del self._dark_ma
         self._dark_mean_ma = None
 
+    @property
+    def dark_ma_count(self):
+        """Number of trains in the moving average of the dark data."""
+        return self.__class__._dark_ma.count
+
     def _setMaWindow(self, v):
         self.__class__._raw_ma.window = v
 
@@ -97,19 +120,17 @@ class GotthardProcessor(QThreadWorker):
         if run is not None:
             try:
                 arr = run.get_array(self._output_channel, self._DATA_PROPERTY)
-                shape = arr.shape
-                if arr.ndim != 3:
-                    self.log.error(f"Data must be a 3D array! "
-                                   f"Actual shape: {shape}")
-                    return
+                _validate_dark_array(arr)
 
-                self.log.info(f"Found dark data with shape {shape}")
+                self.log.info(f"Found dark data with shape {arr.shape}")
                 # FIXME: performance
                 self._dark_ma = np.mean(
                     arr.values, axis=0, dtype=_PIXEL_DTYPE)
                 self._dark_mean_ma = np.mean(
                     self._dark_ma[self._pulse_slicer],
                     axis=0, dtype=_PIXEL_DTYPE)
+            except ProcessingError as e:
+                self.log.error(str(e))
             except Exception as e:
                 self.log.error(f"Unexpect exception when getting data array: "
                                f"{repr(e)}")
@@ -151,27 +172,44 @@ class GotthardProcessor(QThreadWorker):
         if self._recording_dark:
             # update the moving average of dark data
             self._dark_ma = raw
-
-            self._dark_mean_ma = np.mean(
-                self._dark_ma[self._pulse_slicer], axis=0)
+            ma = self._dark_ma
 
             # During dark recording, no offset correcttion is applied and
             # only dark data and its statistics are displayed.
             displayed = raw[self._pulse_slicer]
-            displayed_ma = self._dark_ma[self._pulse_slicer]
+            displayed_ma = ma[self._pulse_slicer]
         else:
             # update the moving average of raw data
             self._raw_ma = raw
+            ma = self._raw_ma
 
             if self._subtract_dark and self._dark_mean_ma is not None:
                 displayed = raw[self._pulse_slicer] - self._dark_mean_ma
-                displayed_ma = self._raw_ma[self._pulse_slicer] - self._dark_mean_ma
+                if ma is raw:
+                    displayed_ma = displayed
+                else:
+                    displayed_ma = ma[self._pulse_slicer] - self._dark_mean_ma
             else:
                 displayed = raw[self._pulse_slicer]
-                displayed_ma = self._raw_ma[self._pulse_slicer]
+                displayed_ma = ma[self._pulse_slicer]
 
         mean = np.mean(displayed, axis=0)
-        mean_ma = np.mean(displayed_ma, axis=0)
+        # The moving average is the current train itself for the first
+        # train or if the moving average window is 1.
+        if ma is raw:
+            mean_ma = mean
+        elif self._recording_dark and self._dark_mean_ma is not None:
+            # The average over pulses is linear, so it follows the same
+            # update as the moving average of the dark data.
+            mean_ma = self._dark_mean_ma + \
+                (mean - self._dark_mean_ma) / self.dark_ma_count
+        else:
+            mean_ma = np.mean(displayed_ma, axis=0)
+
+        if self._recording_dark:
+            # the average over pulses of the moving averaged dark data is
+            # exactly what is needed for dark subtraction
+            self._dark_mean_ma = mean_ma
 
         self.log.info(f"Train {tid} processed")
 
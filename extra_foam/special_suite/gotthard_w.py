@@ -7,8 +7,6 @@ Author: Jun Zhu <jun.zhu@xfel.eu>
 Copyright (C) European X-Ray Free-Electron Laser Facility GmbH.
 All rights reserved.
 """
-from string import Template
-
 from PyQt5.QtCore import pyqtSlot, Qt
 from PyQt5.QtGui import QIntValidator
 from PyQt5.QtWidgets import QCheckBox, QGridLayout, QSplitter
@@ -181,8 +179,8 @@ class GotthardHist(HistMixin, PlotWidgetF):
 
         self._plot = self.plotBar()
 
-        self._title_template = Template(
-            f"mean: $mean, median: $median, std: $std")
+        self._title_template = (
+            "mean: {mean:.2e}, median: {median:.2e}, std: {std:.2e}")
         self.updateTitle()
         self.setLabel('left', 'Occurence')
         self.setLabel('bottom', 'ADU')
@@ -174,7 +174,7 @@ class TestCamViewProcessor:
         np.testing.assert_array_almost_equal(imgdata_gt2, proc._dark_ma)
         np.testing.assert_array_almost_equal(imgdata_gt2, processed["displayed"])
 
-    @pytest.mark.parametrize("subtract_dark", [(True, ), (False,)])
+    @pytest.mark.parametrize("subtract_dark", [True, False])
     def testProcessing(self, subtract_dark):
         from extra_foam.special_suite.cam_view_proc import _IMAGE_DTYPE
 
@@ -1,4 +1,3 @@
-import unittest
 from unittest.mock import MagicMock, patch, PropertyMock
 from collections import Counter
 
@@ -14,7 +13,7 @@ from extra_foam.gui import mkQApp
 from extra_foam.special_suite.gotthard_proc import GotthardProcessor
 from extra_foam.special_suite.gotthard_w import (
     GotthardWindow, GotthardImageView, GotthardAvgPlot, GotthardPulsePlot,
-    GotthardHist
+    GotthardHist, _DEFAULT_N_BINS, _DEFAULT_BIN_RANGE
 )
 from extra_foam.special_suite.special_analysis_base import (
     ProcessingError
@@ -24,107 +23,124 @@ app = mkQApp()
 
 logger.setLevel('CRITICAL')
 
+_DEFAULT_BIN_RANGE_TUPLE = tuple(float(v) for v in _DEFAULT_BIN_RANGE.split(','))
+_DEFAULT_N_BINS_INT = int(_DEFAULT_N_BINS)
 
-class TestGotthard(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        with patch("extra_foam.special_suite.special_analysis_base._SpecialAnalysisBase.startWorker"):
-            cls._win = GotthardWindow('MID')
 
-    @classmethod
-    def tearDown(cls):
-        # explicitly close the MainGUI to avoid error in GuiLogger
-        cls._win.close()
+@pytest.fixture(scope="module")
+def win():
+    """GotthardWindow shared by all the GUI tests in this module."""
+    with patch("extra_foam.special_suite.special_analysis_base._SpecialAnalysisBase.startWorker"):
+        win = GotthardWindow('MID')
+    yield win
+    # explicitly close the MainGUI to avoid error in GuiLogger
+    win.close()
+
+
+class TestGotthard:
+    @pytest.fixture(autouse=True)
+    def setUp(self, win):
+        self._win = win
 
     def testWindow(self):
         win = self._win
 
-        self.assertEqual(4, len(win._plot_widgets))
+        assert 4 == len(win._plot_widgets)
         counter = Counter()
         for key in win._plot_widgets:
             counter[key.__class__] += 1
 
-        self.assertEqual(1, counter[GotthardImageView])
-        self.assertEqual(1, counter[GotthardAvgPlot])
-        self.assertEqual(1, counter[GotthardPulsePlot])
-        self.assertEqual(1, counter[GotthardHist])
+        assert 1 == counter[GotthardImageView]
+        assert 1 == counter[GotthardAvgPlot]
+        assert 1 == counter[GotthardPulsePlot]
+        assert 1 == counter[GotthardHist]
 
         win.updateWidgetsF()
 
     def testCtrl(self):
-        from extra_foam.special_suite.gotthard_w import _DEFAULT_N_BINS, _DEFAULT_BIN_RANGE
-
-        default_bin_range = tuple(float(v) for v in _DEFAULT_BIN_RANGE.split(','))
-
         win = self._win
         ctrl_widget = win._ctrl_widget
         proc = win._worker
 
         # test default values
-        self.assertTrue(proc._output_channel)
-        self.assertEqual(slice(None, None), proc._pulse_slicer)
-        self.assertEqual(0, proc._poi_index)
-        self.assertEqual(1, proc.__class__._raw_ma.window)
-        self.assertTupleEqual(default_bin_range, proc._bin_range)
-        self.assertEqual(int(_DEFAULT_N_BINS), proc._n_bins)
-        self.assertFalse(proc._hist_over_ma)
+        assert proc._output_channel
+        assert slice(None, None) == proc._pulse_slicer
+        assert 0 == proc._poi_index
+        assert 1 == proc.__class__._raw_ma.window
+        assert _DEFAULT_BIN_RANGE_TUPLE == proc._bin_range
+        assert _DEFAULT_N_BINS_INT == proc._n_bins
+        assert not proc._hist_over_ma
 
         # test set new values
         widget = ctrl_widget.output_ch_le
-        widget.clear()
-        QTest.keyClicks(widget, "new/output/channel")
-        QTest.keyPress(widget, Qt.Key_Enter)
-        self.assertEqual("new/output/channel", proc._output_channel)
+        widget.setText("new/output/channel")
+        assert "new/output/channel" == proc._output_channel
 
         widget = ctrl_widget.pulse_slicer_le
-        widget.clear()
-        QTest.keyClicks(widget, "::2")
-        QTest.keyPress(widget, Qt.Key_Enter)
-        self.assertEqual(slice(None, None, 2), proc._pulse_slicer)
+        widget.setText("::2")
+        assert slice(None, None, 2) == proc._pulse_slicer
 
         widget = ctrl_widget.poi_index_le
         widget.clear()
         QTest.keyClicks(widget, "121")
         QTest.keyPress(widget, Qt.Key_Enter)
-        self.assertEqual(0, proc._poi_index)  # maximum is 120 and one can still type "121"
-        widget.clear()
-        QTest.keyClicks(widget, "120")
-        QTest.keyPress(widget, Qt.Key_Enter)
-        self.assertEqual(120, proc._poi_index)
+        assert 0 == proc._poi_index  # maximum is 120 and one can still type "121"
+        widget.setText("120")
+        assert 120 == proc._poi_index
 
         widget = ctrl_widget.ma_window_le
-        widget.clear()
-        QTest.keyClicks(widget, "9")
-        QTest.keyPress(widget, Qt.Key_Enter)
-        self.assertEqual(9, proc.__class__._raw_ma.window)
+        widget.setText("9")
+        assert 9 == proc.__class__._raw_ma.window
 
         widget = ctrl_widget.bin_range_le
-        widget.clear()
-        QTest.keyClicks(widget, "-1.0, 1.0")
-        QTest.keyPress(widget, Qt.Key_Enter)
-        self.assertTupleEqual((-1.0, 1.0), proc._bin_range)
+        widget.setText("-1.0, 1.0")
+        assert (-1.0, 1.0) == proc._bin_range
 
         widget = ctrl_widget.n_bins_le
         widget.clear()
         QTest.keyClicks(widget, "1000")
         QTest.keyPress(widget, Qt.Key_Enter)
-        self.assertEqual(100, proc._n_bins)  # maximum is 999 and one can not put the 3rd 0 in
-        widget.clear()
-        QTest.keyClicks(widget, "999")
-        QTest.keyPress(widget, Qt.Key_Enter)
-        self.assertEqual(999, proc._n_bins)
+        assert 100 == proc._n_bins  # maximum is 999 and one can not put the 3rd 0 in
+        widget.setText("999")
+        assert 999 == proc._n_bins
 
         ctrl_widget.hist_over_ma_cb.setChecked(True)
-        self.assertTrue(proc._hist_over_ma)
+        assert proc._hist_over_ma
+
+
+@pytest.fixture(scope="module")
+def proc_and_adc():
+    """GotthardProcessor and ADC data shared by all the processor tests.
+
+    The ADC data of the trains are scaled by 1, 2 and 3 and are read-only.
+    """
+    proc = GotthardProcessor(object(), object())
+    proc._output_channel = "gotthard:output"
+    adc = np.random.randint(0, 100, size=(4, 4), dtype=np.uint16)
+    scaled_adc = {times: adc * times for times in (1, 2, 3)}
+    for arr in scaled_adc.values():
+        arr.setflags(write=False)
+    return proc, scaled_adc
 
 
 class TestGotthardProcessor:
     @pytest.fixture(autouse=True)
-    def setUp(self):
-        self._proc = GotthardProcessor(object(), object())
+    def setUp(self, proc_and_adc):
+        self._proc, self._scaled_adc = proc_and_adc
+        self._adc = self._scaled_adc[1]
+        self._data_3d = np.ones((4, 2, 2))
 
-        self._proc._output_channel = "gotthard:output"
-        self._adc = np.random.randint(0, 100, size=(4, 4), dtype=np.uint16)
+        # reset the states which are modified by the tests
+        proc = self._proc
+        proc._pulse_slicer = slice(None, None)
+        proc._poi_index = 0
+        proc._hist_over_ma = False
+        proc._recording_dark = False
+        proc._subtract_dark = True
+        proc._setMaWindow(1)
+        del proc._raw_ma
+        del proc._dark_ma
+        proc._dark_mean_ma = None
 
     def _get_data(self, times=1):
         # data, meta
@@ -132,8 +148,8 @@ class TestGotthardProcessor:
             {
                 self._proc._output_channel: {
                     "metadata": {"timestamp.tid": 12345},
-                    GotthardProcessor._DATA_PROPERTY: self._adc * times,
-                    "data.3d": np.ones((4, 2, 2))
+                    GotthardProcessor._DATA_PROPERTY: self._scaled_adc[times],
+                    "data.3d": self._data_3d
                 },
             },
             {}
@@ -194,6 +210,23 @@ class TestGotthardProcessor:
                 info.assert_called_once()
                 error.assert_not_called()
 
+    @staticmethod
+    def _check_processed(processed, expected):
+        for key, desired in expected.items():
+            np.testing.assert_allclose(processed[key], desired, rtol=1e-6)
+
+    def testValidateDarkArray(self):
+        from extra_foam.special_suite.gotthard_proc import _validate_dark_array
+
+        _validate_dark_array(np.ones((4, 3, 2), dtype=np.uint16))
+        _validate_dark_array(np.ones((4, 3), dtype=np.float32), ndim=2)
+
+        with pytest.raises(ProcessingError, match="3D array"):
+            _validate_dark_array(np.ones((4, 3)))
+
+        with pytest.raises(ProcessingError, match="numeric"):
+            _validate_dark_array(np.array([[["a"]]]))
+
     def testProcessingWhenRecordingDark(self):
         from extra_foam.special_suite.gotthard_proc import _PIXEL_DTYPE
 
@@ -206,37 +239,68 @@ class TestGotthardProcessor:
         adc_gt = self._adc.astype(_PIXEL_DTYPE)
         adc_gt2 = 2.0 * self._adc
         adc_gt_avg = 1.5 * self._adc
+        adc_gt_mean = np.mean(adc_gt, axis=0)
+        adc_gt2_mean = np.mean(adc_gt2, axis=0)
+        adc_gt_avg_mean = np.mean(adc_gt_avg, axis=0)
 
         # 1st train
         processed = proc.process(self._get_data())
-        np.testing.assert_array_almost_equal(adc_gt, proc._dark_ma)
-        np.testing.assert_array_almost_equal(np.mean(adc_gt, axis=0), proc._dark_mean_ma)
+        np.testing.assert_allclose(proc._dark_ma, adc_gt, rtol=1e-6)
+        np.testing.assert_allclose(proc._dark_mean_ma, adc_gt_mean, rtol=1e-6)
         assert 0 == processed["poi_index"]
-        np.testing.assert_array_almost_equal(adc_gt, processed["displayed"])
-        np.testing.assert_array_almost_equal(adc_gt, processed["displayed_ma"])
-        np.testing.assert_array_almost_equal(np.mean(adc_gt, axis=0), processed["mean"])
-        np.testing.assert_array_almost_equal(np.mean(adc_gt, axis=0), processed["mean_ma"])
-        assert np.mean(adc_gt) == processed["hist"][2]
+        self._check_processed(processed, {
+            "displayed": adc_gt,
+            "displayed_ma": adc_gt,
+            "mean": adc_gt_mean,
+            "mean_ma": adc_gt_mean,
+        })
+        assert np.mean(adc_gt) == pytest.approx(processed["hist"][2])
 
         # 2nd train
         processed = proc.process(self._get_data(2))
-        np.testing.assert_array_almost_equal(adc_gt_avg, proc._dark_ma)
-        np.testing.assert_array_almost_equal(np.mean(adc_gt_avg, axis=0), proc._dark_mean_ma)
+        np.testing.assert_allclose(proc._dark_ma, adc_gt_avg, rtol=1e-6)
+        np.testing.assert_allclose(proc._dark_mean_ma, adc_gt_avg_mean, rtol=1e-6)
         assert 0 == processed["poi_index"]
-        np.testing.assert_array_almost_equal(adc_gt2, processed["displayed"])
-        np.testing.assert_array_almost_equal(adc_gt_avg, processed["displayed_ma"])
-        np.testing.assert_array_almost_equal(np.mean(adc_gt2, axis=0), processed["mean"])
-        np.testing.assert_array_almost_equal(np.mean(adc_gt_avg, axis=0), processed["mean_ma"])
-        assert np.mean(adc_gt2) == processed["hist"][2]
+        self._check_processed(processed, {
+            "displayed": adc_gt2,
+            "displayed_ma": adc_gt_avg,
+            "mean": adc_gt2_mean,
+            "mean_ma": adc_gt_avg_mean,
+        })
+        assert np.mean(adc_gt2) == pytest.approx(processed["hist"][2])
 
         # 3nd train
         proc._hist_over_ma = True
         processed = proc.process(self._get_data(3))
-        np.testing.assert_array_almost_equal(adc_gt2, proc._dark_ma)
-        np.testing.assert_array_almost_equal(np.mean(adc_gt2, axis=0), proc._dark_mean_ma)
-        assert np.mean(adc_gt2) == processed["hist"][2]
+        np.testing.assert_allclose(proc._dark_ma, adc_gt2, rtol=1e-6)
+        np.testing.assert_allclose(proc._dark_mean_ma, adc_gt2_mean, rtol=1e-6)
+        assert np.mean(adc_gt2) == pytest.approx(processed["hist"][2])
 
-    @pytest.mark.parametrize("subtract_dark", [(True, ), (False,)])
+    def testDarkMeanMaWindowRollOver(self):
+        proc = self._proc
+        proc._recording_dark = True
+        proc.__class__._dark_ma.window = 3
+
+        try:
+            frames = []
+            for i, times in enumerate([1, 2, 3, 1, 2, 3], 1):
+                frames.append(self._scaled_adc[times])
+                proc.process(self._get_data(times))
+                assert min(i, 3) == proc.dark_ma_count
+
+                # pulse average of the retained moving averaged dark data
+                np.testing.assert_allclose(
+                    np.mean(proc._dark_ma, axis=0), proc._dark_mean_ma,
+                    rtol=1e-5)
+                if i <= 3:
+                    # exact mean before the window rolls over
+                    np.testing.assert_allclose(
+                        np.mean(frames, axis=(0, 1)), proc._dark_mean_ma,
+                        rtol=1e-5)
+        finally:
+            proc.__class__._dark_ma.window = 2147483647
+
+    @pytest.mark.parametrize("subtract_dark", [True, False])
     def testProcessing(self, subtract_dark):
         from extra_foam.special_suite.gotthard_proc import _PIXEL_DTYPE
 
@@ -256,30 +320,38 @@ class TestGotthardProcessor:
             adc_gt -= offset
             adc_gt2 -= offset
             adc_gt_avg -= offset
+        adc_gt_mean = np.mean(adc_gt, axis=0)
 
         # 1st train
         processed = proc.process(self._get_data())
         assert 1 == processed["poi_index"]
-        np.testing.assert_array_almost_equal(adc_gt, processed["displayed"])
-        np.testing.assert_array_almost_equal(adc_gt, processed["displayed_ma"])
-        np.testing.assert_array_almost_equal(np.mean(adc_gt, axis=0), processed["mean"])
-        np.testing.assert_array_almost_equal(np.mean(adc_gt, axis=0), processed["mean_ma"])
-        assert np.mean(adc_gt) == processed["hist"][2]
+        self._check_processed(processed, {
+            "displayed": adc_gt,
+            "displayed_ma": adc_gt,
+            "mean": adc_gt_mean,
+            "mean_ma": adc_gt_mean,
+        })
+        assert np.mean(adc_gt) == pytest.approx(processed["hist"][2])
+        # the moving average is the current train itself
+        assert processed["mean_ma"] is processed["mean"]
 
         # 2nd train
         proc._setMaWindow(3)
         processed = proc.process(self._get_data(2))
         assert 1 == processed["poi_index"]
-        np.testing.assert_array_almost_equal(adc_gt2, processed["displayed"])
-        np.testing.assert_array_almost_equal(adc_gt_avg, processed["displayed_ma"])
-        np.testing.assert_array_almost_equal(np.mean(adc_gt2, axis=0), processed["mean"])
-        np.testing.assert_array_almost_equal(np.mean(adc_gt_avg, axis=0), processed["mean_ma"])
-        assert np.mean(adc_gt2) == processed["hist"][2]
+        self._check_processed(processed, {
+            "displayed": adc_gt2,
+            "displayed_ma": adc_gt_avg,
+            "mean": np.mean(adc_gt2, axis=0),
+            "mean_ma": np.mean(adc_gt_avg, axis=0),
+        })
+        assert processed["mean_ma"] is not processed["mean"]
+        assert np.mean(adc_gt2) == pytest.approx(processed["hist"][2])
 
         # 3nd train
         proc._hist_over_ma = True
         processed = proc.process(self._get_data(3))
-        assert np.mean(adc_gt2) == processed["hist"][2]
+        assert np.mean(adc_gt2) == pytest.approx(processed["hist"][2])
 
     def testPulseSlicerChange(self):
         proc = self._proc
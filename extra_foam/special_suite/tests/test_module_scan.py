@@ -1,5 +1,3 @@
-import unittest
-import unittest
 from unittest.mock import MagicMock, patch
 from collections import Counter
 
@@ -19,29 +17,33 @@ app = mkQApp()
 logger.setLevel('CRITICAL')
 
 
-class TestModuleScan(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        with patch("extra_foam.special_suite.special_analysis_base._SpecialAnalysisBase.startWorker"):
-            cls._win = ModuleScanWindow('DET')
+@pytest.fixture(scope="module")
+def win():
+    """ModuleScanWindow shared by all the GUI tests in this module."""
+    with patch("extra_foam.special_suite.special_analysis_base._SpecialAnalysisBase.startWorker"):
+        win = ModuleScanWindow('DET')
+    yield win
+    # explicitly close the MainGUI to avoid error in GuiLogger
+    win.close()
 
-    @classmethod
-    def tearDown(cls):
-        # explicitly close the MainGUI to avoid error in GuiLogger
-        cls._win.close()
+
+class TestModuleScan:
+    @pytest.fixture(autouse=True)
+    def setUp(self, win):
+        self._win = win
 
     def testWindow(self):
         win = self._win
 
-        self.assertEqual(1, len(win._plot_widgets))
+        assert 1 == len(win._plot_widgets)
         counter = Counter()
         for key in win._plot_widgets:
             counter[key.__class__] += 1
 
-        # self.assertEqual(1, counter[GotthardImageView])
-        # self.assertEqual(1, counter[GotthardAvgPlot])
-        # self.assertEqual(1, counter[GotthardPulsePlot])
-        # self.assertEqual(1, counter[GotthardHist])
+        # assert 1 == counter[GotthardImageView]
+        # assert 1 == counter[GotthardAvgPlot]
+        # assert 1 == counter[GotthardPulsePlot]
+        # assert 1 == counter[GotthardHist]
         #
         # win.updateWidgetsF()
 
@@ -0,0 +1,54 @@
+import importlib
+import os
+import unittest
+from unittest.mock import patch
+
+from extra_foam import utils
+from extra_foam.logger import logger
+
+logger.setLevel("CRITICAL")
+
+
+def _func(a, b=1):
+    """Docstring of _func."""
+    return a + b
+
+
+class TestProfiler(unittest.TestCase):
+    def tearDown(self):
+        # restore the module for the current environment
+        importlib.reload(utils)
+
+    def testDisabled(self):
+        with patch.dict(os.environ):
+            os.environ.pop("EXTRA_FOAM_PROFILE", None)
+            importlib.reload(utils)
+
+        self.assertFalse(utils.PROFILER_ENABLED)
+        self.assertIs(_func, utils.profiler("func")(_func))
+        self.assertIs(_func, utils.profiler("func", process_time=True)(_func))
+
+    def testEnabled(self):
+        with patch.dict(os.environ, {"EXTRA_FOAM_PROFILE": "1"}):
+            importlib.reload(utils)
+
+        self.assertTrue(utils.PROFILER_ENABLED)
+        for process_time in (False, True):
+            timed_func = utils.profiler(
+                "func", process_time=process_time)(_func)
+            self.assertIsNot(_func, timed_func)
+            self.assertEqual("_func", timed_func.__name__)
+            self.assertEqual("Docstring of _func.", timed_func.__doc__)
+
+            with patch.object(utils.logger, "debug") as debug:
+                with patch.object(utils, "PROFILER_THREASHOLD", -1):
+                    self.assertEqual(3, timed_func(1, b=2))
+                debug.assert_called_once()
+                self.assertIn("Process time spent on func",
+                              debug.call_args[0][0])
+
+                # not logged below the threshold
+                debug.reset_mock()
+                with patch.object(utils, "PROFILER_THREASHOLD", float("inf")):
+                    self.assertEqual(2, timed_func(1))
+                debug.assert_not_called()
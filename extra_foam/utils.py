@@ -22,8 +22,15 @@ from .logger import logger
 # function takes more than the threshold value.
 PROFILER_THREASHOLD = 1.0  # in ms
 
+# profiler only wraps the decorated function if the environment variable
+# EXTRA_FOAM_PROFILE is set to "1" when the modules are imported.
+PROFILER_ENABLED = os.environ.get("EXTRA_FOAM_PROFILE") == "1"
+
 
 def profiler(info, *, process_time=False):
+    if not PROFILER_ENABLED:
+        return lambda f: f
+
     def wrap(f):
         @functools.wraps(f)
         def timed_f(*args, **kwargs):